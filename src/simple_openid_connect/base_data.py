@@ -4,11 +4,13 @@ Base data types which are extended with concrete OpenId data types in :mod:`simp
 import abc
 import logging
 from typing import List, Literal, Type, TypeVar
+from urllib.parse import urlsplit
 
 from cryptojwt import JWK, JWS, JWT, KeyBundle, KeyJar
-from furl import Query, furl
 from pydantic import BaseModel
 
+from simple_openid_connect import utils
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,9 +32,7 @@ class OpenidBaseModel(BaseModel, metaclass=abc.ABCMeta):
         `x-www-form-urlencoded` request body
 
         """
-        query = Query()
-        query.set(self.dict(exclude_defaults=True))
-        return query.encode()  # type: ignore # because furl has no typedefs, but we know what this returns
+        return utils.encode_query(self.dict(exclude_defaults=True))
 
     def encode_url(self, url: str) -> str:
         """
@@ -42,18 +42,14 @@ class OpenidBaseModel(BaseModel, metaclass=abc.ABCMeta):
         responses can be returned via a fragment and since this library is only intended for usage as a relying party,
         it should never need to generate responses.
         """
-        url_parsed = furl(url)
-        url_parsed.args.update(self.dict(exclude_defaults=True))
-        return url_parsed.tostr()  # type: ignore # because furl has no typedefs, but we know what this returns
+        return utils.update_url_query(url, self.dict(exclude_defaults=True))
 
     @classmethod
     def parse_x_www_form_urlencoded(cls: Type[Self], s: str) -> Self:
         """
         Parse a received message that is parsed from the given `x-www-form-urlencoded` formatted string.
         """
-        query = Query(s)
-        one_value_params = {key: query.params[key] for key in query.params.keys()}
-        return cls.parse_obj(one_value_params)
+        return cls.parse_obj(utils.parse_query(s))
 
     @classmethod
     def parse_url(
@@ -69,10 +65,9 @@ class OpenidBaseModel(BaseModel, metaclass=abc.ABCMeta):
             If set to 'auto', fragment will be tried first with query being used as a fallback.
         """
         if location == "query":
-            return cls.parse_x_www_form_urlencoded(str(furl(url).query))
+            return cls.parse_x_www_form_urlencoded(urlsplit(url).query)
         elif location == "fragment":
-            fragment = furl(url).fragment.query
-            return cls.parse_x_www_form_urlencoded(str(fragment))
+            return cls.parse_x_www_form_urlencoded(urlsplit(url).fragment)
         elif location == "auto":
             try:
                 return cls.parse_url(url, location="fragment")
@@ -2,29 +2,42 @@
 A more contiguous client implementation of the Openid-Connect protocol that offers simpler APIs at the cost of losing some flexibility.
 """
 
+import base64
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
 from typing import (
     Any,
     Callable,
     Dict,
     List,
     Literal,
-    Mapping,
     Optional,
+    Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
 )
 
+import requests
 from cryptojwt import JWK
 from cryptojwt.jwk.jwk import key_from_jwk_dict
+from cryptojwt.jws.exception import NoSuitableSigningKeys
+from requests.adapters import HTTPAdapter
 
 from simple_openid_connect import (
+    discovery,
     jwk,
     rp_initiated_logout,
     token_introspection,
     token_refresh,
     userinfo,
 )
+from simple_openid_connect.base_data import OpenidBaseModel
 from simple_openid_connect.client_authentication import (
     ClientAuthenticationMethod,
     ClientSecretBasicAuth,
@@ -41,7 +54,6 @@ from simple_openid_connect.data import (
     UserinfoErrorResponse,
     UserinfoSuccessResponse,
 )
-from simple_openid_connect.discovery import discover_configuration_from_issuer
 from simple_openid_connect.exceptions import UnsupportedByProviderError
 from simple_openid_connect.flows.authorization_code_flow.client import (
     AuthorizationCodeFlowClient,
@@ -52,19 +64,71 @@ from simple_openid_connect.flows.client_credentials_grant.client import (
 from simple_openid_connect.flows.direct_access_grant.client import (
     DirectAccessGrantClient,
 )
+from simple_openid_connect.utils import TTLCache
 
 Self = TypeVar("Self", bound="OpenidClient")
+Model = TypeVar("Model", bound=OpenidBaseModel)
+# how many seconds a JWT is still assumed to be valid after its exp claim to allow for clocks that are not in sync
+JWT_EXPIRY_LEEWAY = 60
+
+CachedResponse = TypeVar(
+    "CachedResponse", UserinfoSuccessResponse, TokenIntrospectionSuccessResponse
+)
+
+
+def clear_provider_cache() -> None:
+    """
+    Forget all provider configurations and keys that have been cached while constructing clients.
+
+    This is useful when a provider is known to have rotated its keys.
+    """
+    discovery.clear_cache()
+    jwk.clear_cache()
+
+
+def _new_session() -> requests.Session:
+    # pooled connections allow subsequent requests to the OP to skip establishing a new connection each
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class OpenidClient:
     """
     A more contiguous client implementation of the Openid-Connect protocol that offers simpler APIs at the cost of losing some flexibility.
+
+    Instances define `__slots__` so no additional attributes can be set on them.
+    Subclasses that need to carry more state can declare it themselves.
     """
 
+    __slots__ = (
+        "provider_config",
+        "provider_keys",
+        "client_auth",
+        "scope",
+        "authentication_redirect_uri",
+        "authorization_code_flow",
+        "direct_access_grant",
+        "client_credentials_grant",
+        "cache_ttl_seconds",
+        "_max_cache_size",
+        "_id_token_cache",
+        "_introspection_cache",
+        "_userinfo_cache",
+        "_sid_index",
+        "_sid_index_size",
+        "_sid_index_limit",
+        "_sid_lock",
+        "_session",
+    )
+
     provider_config: ProviderMetadata
     provider_keys: List[JWK]
     client_auth: ClientAuthenticationMethod
     scope: str
+    authentication_redirect_uri: Optional[str]
 
     authorization_code_flow: AuthorizationCodeFlowClient
     "*authorization code flow* related functionality"
@@ -75,6 +139,22 @@ class OpenidClient:
     client_credentials_grant: ClientCredentialsGrantClient
     "*Client Credentials Grant* (or *Service Account Authentication*) functionality"
 
+    PERSISTENCE_VERSION = 1
+    "Version of the format in which :func:`save` stores clients. Files that were saved with another version are not loaded."
+
+    cache_ttl_seconds: int
+    "For how many seconds responses of the OP are cached at most (0 disables caching)"
+
+    _max_cache_size: int
+    _id_token_cache: Optional[TTLCache[bytes, IdToken]]
+    _introspection_cache: Optional[TTLCache[str, TokenIntrospectionSuccessResponse]]
+    _userinfo_cache: Optional[TTLCache[str, UserinfoSuccessResponse]]
+    _sid_index: Optional[Dict[str, Set[str]]]
+    _sid_index_size: int
+    _sid_index_limit: int
+    _sid_lock: threading.Lock
+    _session: Optional[requests.Session]
+
     def __init__(
         self,
         provider_config: ProviderMetadata,
@@ -83,6 +163,10 @@ class OpenidClient:
         client_id: str,
         client_secret: Optional[str] = None,
         scope: str = "openid",
+        cache_validated_jwts: bool = False,
+        cache_ttl_seconds: int = 0,
+        max_cache_size: int = 10_000,
+        session: Optional[requests.Session] = None,
     ):
         self.provider_config = provider_config
         self.provider_keys = provider_keys
@@ -91,6 +175,24 @@ class OpenidClient:
         self.client_credentials_grant = ClientCredentialsGrantClient(self)
         self.scope = scope
         self.authentication_redirect_uri = authentication_redirect_uri
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._max_cache_size = max_cache_size
+        self._id_token_cache = (
+            TTLCache(max_cache_size) if cache_validated_jwts else None
+        )
+        self._introspection_cache = (
+            TTLCache(max_cache_size) if cache_ttl_seconds > 0 else None
+        )
+        self._userinfo_cache = (
+            TTLCache(max_cache_size) if cache_ttl_seconds > 0 else None
+        )
+        # maps session ids to the cache keys of responses that belong to that session
+        self._sid_index = {} if cache_ttl_seconds > 0 else None
+        # the number of cache keys in the index and how many of them are allowed before it is pruned
+        self._sid_index_size = 0
+        self._sid_index_limit = max_cache_size
+        self._sid_lock = threading.Lock()
+        self._session = session
 
         if client_secret is None:
             self.client_auth = NoneAuth(client_id)
@@ -113,10 +215,18 @@ class OpenidClient:
         client_id: str,
         client_secret: Union[str, None] = None,
         scope: str = "openid",
+        cache_validated_jwts: bool = False,
+        cache_ttl_seconds: int = 0,
+        max_cache_size: int = 10_000,
+        session: Optional[requests.Session] = None,
     ) -> Self:
         """
         Create a new client instance with an issuer url as base, automatically discovering information about the issuer in the process.
 
+        The discovered configuration and keys are cached for as long as the provider allows so that constructing
+        further clients for the same issuer usually does not require any requests to it.
+        Use :func:`clear_provider_cache` to discard them earlier.
+
         :param url: The url to an Openid issuer
         :param authentication_redirect_uri: URI that is used during the authentication flow to redirect back to this application.
         :param client_id: The already known client id of your application.
@@ -124,11 +234,27 @@ class OpenidClient:
         :param client_secret: Optionally a client secret which has been assigned to your client from the issuer.
             If not supplied, this client is assumed to be *public* which means it has not client secret because it cannot be kept safe (e.g. a web-app).
         :param scope: Which scopes to request from the OP
+        :param cache_validated_jwts: Whether to remember ID-Tokens whose signature has already been verified until they expire.
+            See :func:`decode_id_token`.
+        :param cache_ttl_seconds: For how many seconds responses of the OP about a token (e.g. introspection results) may be reused.
+            Defaults to 0 which disables caching so that the OP is asked every time.
+        :param max_cache_size: How many responses and validated ID tokens are cached at most per kind.
+        :param session: The HTTP session through which requests to the OP are sent.
+            If not given, a new one is created which is then also used by the client afterwards.
         """
-
-        config = discover_configuration_from_issuer(url)
+        # discovery and key retrieval share one session so that the latter can reuse the connection to the provider
+        session = session or _new_session()
+        config = discovery.discover_configuration_from_issuer(url, session=session)
         return cls.from_issuer_config(
-            config, authentication_redirect_uri, client_id, client_secret, scope
+            config,
+            authentication_redirect_uri,
+            client_id,
+            client_secret,
+            scope,
+            cache_validated_jwts,
+            cache_ttl_seconds,
+            max_cache_size,
+            session,
         )
 
     @classmethod
@@ -139,6 +265,10 @@ class OpenidClient:
         client_id: str,
         client_secret: Union[str, None] = None,
         scope: str = "openid",
+        cache_validated_jwts: bool = False,
+        cache_ttl_seconds: int = 0,
+        max_cache_size: int = 10_000,
+        session: Optional[requests.Session] = None,
     ) -> Self:
         """
         Create a new client instance with a resolved issuer configuration as base.
@@ -152,12 +282,65 @@ class OpenidClient:
         :param client_secret: Optionally a client secret which has been assigned to your client from the issuer.
             If not supplied, this client is assumed to be *public* which means it has not client secret because it cannot be kept safe (e.g. a web-app).
         :param scope: Which scopes to request from the OP
+        :param cache_validated_jwts: Whether to remember ID-Tokens whose signature has already been verified until they expire.
+            See :func:`decode_id_token`.
+        :param cache_ttl_seconds: For how many seconds responses of the OP about a token (e.g. introspection results) may be reused.
+            Defaults to 0 which disables caching so that the OP is asked every time.
+        :param max_cache_size: How many responses and validated ID tokens are cached at most per kind.
+        :param session: The HTTP session through which requests to the OP are sent.
+            If not given, a new one is created which is then also used by the client afterwards.
         """
-        keys = jwk.fetch_jwks(config.jwks_uri)
+        session = session or _new_session()
+        keys = jwk.fetch_jwks(config.jwks_uri, session=session)
         return cls(
-            config, keys, authentication_redirect_uri, client_id, client_secret, scope
+            config,
+            list(keys),
+            authentication_redirect_uri,
+            client_id,
+            client_secret,
+            scope,
+            cache_validated_jwts,
+            cache_ttl_seconds,
+            max_cache_size,
+            session,
         )
 
+    def save(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """
+        Persist this client including the discovered provider configuration and keys to the given file so that it can
+        later be restored with :func:`load` without contacting the OP.
+
+        :param path: The file to which the client is written. An existing file is overwritten.
+        """
+        with open(path, "wb") as f:
+            pickle.dump(
+                (self.PERSISTENCE_VERSION, self), f, protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+    @classmethod
+    def load(cls: Type[Self], path: Union[str, "os.PathLike[str]"]) -> Optional[Self]:
+        """
+        Restore a client that has previously been persisted with :func:`save`.
+
+        Note that the file is unpickled, so it must only ever be written by the application itself.
+        Also consider that providers rotate their keys from time to time so a saved client should not be reused
+        indefinitely.
+
+        :param path: The file from which the client is read.
+
+        :returns: The restored client or `None` if the file does not exist or has been saved by an incompatible version
+            of this library in which case a new client should be created e.g. via :func:`from_issuer_url`.
+        """
+        try:
+            with open(path, "rb") as f:
+                version, client = pickle.load(f)
+        except FileNotFoundError:
+            return None
+
+        if version != cls.PERSISTENCE_VERSION or not isinstance(client, cls):
+            return None
+        return client
+
     @property
     def client_type(self) -> Literal["public", "confidential"]:
         """
@@ -170,6 +353,52 @@ class OpenidClient:
         else:
             return "confidential"
 
+    def refresh_provider_keys(self) -> bool:
+        """
+        Fetch the providers signing keys again e.g. because it has rotated them.
+
+        To not overload the provider, this only sends a request if the keys have not been fetched within the last
+        :data:`jwk.MIN_REFRESH_INTERVAL <simple_openid_connect.jwk.MIN_REFRESH_INTERVAL>` seconds.
+
+        :returns: Whether the keys have changed
+        """
+        keys = jwk.fetch_jwks(
+            self.provider_config.jwks_uri, session=self.session, refresh=True
+        )
+        if keys == self.provider_keys:
+            return False
+        self.provider_keys = keys
+        return True
+
+    def parse_jwt(self, model: Type[Model], raw_token: str) -> Model:
+        """
+        Parse a JWT that was signed by the provider into the given model type after verifying its signature.
+
+        If the token was signed by a key that is not known, the providers keys are refreshed once via
+        :func:`refresh_provider_keys` so that tokens signed with rotated keys are accepted as well.
+
+        :param model: The type of data that is encoded in the token e.g. :class:`IdToken`
+        :param raw_token: The encoded and signed token
+        """
+        try:
+            return model.parse_jwt(raw_token, self.provider_keys)
+        except NoSuitableSigningKeys:
+            if not self.refresh_provider_keys():
+                raise
+            return model.parse_jwt(raw_token, self.provider_keys)
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The HTTP session through which this client sends its requests to the OP.
+
+        It is created on first use and pools connections so that subsequent requests to the OP don't need to establish
+        a new connection each.
+        """
+        if self._session is None:
+            self._session = _new_session()
+        return self._session
+
     def fetch_userinfo(
         self, access_token: str
     ) -> Union[UserinfoSuccessResponse, UserinfoErrorResponse]:
@@ -178,6 +407,10 @@ class OpenidClient:
 
         Which users information is fetched is determined by the OP directly from the used access token.
 
+        If this client was constructed with a positive `cache_ttl_seconds`, successful responses are reused for that
+        many seconds but never beyond the expiry of the access token if it is a JWT.
+        Use :func:`invalidate_token` or :func:`invalidate_sid` to discard them earlier e.g. when the user has logged out.
+
         :param access_token: An access token which grants access to user information.
 
         :raises UnsupportedByProviderError: If the provider does not support userinfo requests or the userinfo endpoint is not known.
@@ -189,10 +422,35 @@ class OpenidClient:
                 f"The OpenID provider {self.provider_config.issuer} does not support userinfo requests or does not advertise its userinfo endpoint"
             )
 
-        return userinfo.fetch_userinfo(
-            self.provider_config.userinfo_endpoint, access_token
+        # expired JWTs are never answered from the cache but passed on to the OP which will reject them
+        exp = self._jwt_expiry(access_token)
+        use_cache = self._userinfo_cache is not None and (
+            exp is None or exp > time.time()
+        )
+
+        cache_key = self._token_cache_key(access_token)
+        if use_cache and self._userinfo_cache is not None:
+            cached = self._userinfo_cache.get(cache_key)
+            if cached is not None:
+                return cached.model_copy(deep=True)
+
+        response = userinfo.fetch_userinfo(
+            self.provider_config.userinfo_endpoint, access_token, session=self.session
         )
 
+        if (
+            use_cache
+            and self._userinfo_cache is not None
+            and isinstance(response, UserinfoSuccessResponse)
+        ):
+            self._store_response(
+                self._userinfo_cache,
+                cache_key,
+                response,
+                ttl=self._cache_ttl_until(exp),
+            )
+        return response
+
     def decode_id_token(
         self,
         raw_token: str,
@@ -208,6 +466,10 @@ class OpenidClient:
         Issuer and client id for validation are taken from the client configuration but extra optional validation
         information can be supplied as well.
 
+        If this client was constructed with `cache_validated_jwts=True`, tokens that have already been decoded and
+        validated successfully are remembered until they expire so that their signature is not verified again.
+        The validation of the tokens claims against the given parameters is still performed on every call.
+
         :param raw_token: The encoded and signed id token.
             This could e.g. be retrieved as part of the authentication process and returned by the OP in :data:`TokenSuccessResponse.id_token <simple_openid_connect.flows.authorization_code_flow.data.TokenSuccessResponse.id_token>`.
         :param nonce: The nonce that was used during authentication.
@@ -226,7 +488,18 @@ class OpenidClient:
 
         :raises ValidationError: if the validation fails
         """
-        token = IdToken.parse_jwt(raw_token, self.provider_keys)
+        cache_key = None
+        cached_token = None
+        if self._id_token_cache is not None:
+            cache_key = hashlib.blake2b(raw_token.encode(), digest_size=16).digest()
+            cached_token = self._id_token_cache.get(cache_key)
+
+        if cached_token is not None:
+            # callers get their own copy so that modifying it cannot alter what later lookups return
+            token = cached_token.model_copy(deep=True)
+        else:
+            token = self.parse_jwt(IdToken, raw_token)
+
         token.validate_extern(
             issuer=self.provider_config.issuer,
             client_id=self.client_auth.client_id,
@@ -236,6 +509,15 @@ class OpenidClient:
             validate_acr=validate_acr,
             min_auth_time=min_auth_time,
         )
+
+        if (
+            self._id_token_cache is not None
+            and cache_key is not None
+            and cached_token is None
+        ):
+            self._id_token_cache.set(
+                cache_key, token.model_copy(deep=True), ttl=token.exp - time.time()
+            )
         return token
 
     def exchange_refresh_token(
@@ -257,6 +539,7 @@ class OpenidClient:
             token_endpoint=self.provider_config.token_endpoint,
             refresh_token=refresh_token,
             client_authentication=self.client_auth,
+            session=self.session,
         )
 
     def initiate_logout(
@@ -286,6 +569,13 @@ class OpenidClient:
         """
         Introspect the given token at the OP.
 
+        If this client was constructed with a positive `cache_ttl_seconds`, responses that state a token to be active
+        are reused for that many seconds but never beyond the tokens expiry.
+
+        With caching enabled, tokens that are JWTs whose `exp` claim lies more than :data:`JWT_EXPIRY_LEEWAY <simple_openid_connect.client.JWT_EXPIRY_LEEWAY>`
+        seconds in the past are also reported as inactive without asking the OP.
+        The leeway accounts for this apps clock running ahead of the OPs.
+
         :param token: The token to introspect.
         :param token_type_hint: Which type of token this is e.g. `refresh_token` or `access_token`.
 
@@ -298,22 +588,208 @@ class OpenidClient:
                 f"The OpenID provider {self.provider_config.issuer} does not support token introspection"
             )
 
-        return token_introspection.introspect_token(
+        if self._introspection_cache is not None and self._is_expired_jwt(token):
+            return TokenIntrospectionSuccessResponse(active=False)
+
+        cache_key = self._token_cache_key(token)
+        if self._introspection_cache is not None:
+            cached = self._introspection_cache.get(cache_key)
+            if cached is not None:
+                return cached.model_copy(deep=True)
+
+        response = token_introspection.introspect_token(
             introspection_endpoint=self.provider_config.introspection_endpoint,
             token=token,
             auth=self.client_auth,
             token_type_hint=token_type_hint,
+            session=self.session,
         )
 
-    def __getstate__(self) -> Mapping[str, Any]:
+        if (
+            self._introspection_cache is not None
+            and isinstance(response, TokenIntrospectionSuccessResponse)
+            and response.active
+        ):
+            self._store_response(
+                self._introspection_cache,
+                cache_key,
+                response,
+                ttl=self._cache_ttl_until(response.exp),
+            )
+        return response
+
+    def invalidate_token(self, token: str) -> None:
+        """
+        Discard all cached responses of the OP that concern the given token.
+
+        :param token: The access token whose userinfo and introspection results should no longer be reused.
+        """
+        cache_key = self._token_cache_key(token)
+        if self._userinfo_cache is not None:
+            self._userinfo_cache.discard(cache_key)
+        if self._introspection_cache is not None:
+            self._introspection_cache.discard(cache_key)
+
+    def invalidate_sid(self, sid: str) -> None:
+        """
+        Discard all cached responses of the OP that concern tokens of the given session.
+
+        This is useful when the OP notifies this app about a logout e.g. via a
+        :class:`BackChannelLogoutToken <simple_openid_connect.data.BackChannelLogoutToken>`.
+
+        :param sid: The session id as communicated by the OP in its responses.
+        """
+        if self._sid_index is None:
+            return
+        with self._sid_lock:
+            cache_keys = self._sid_index.pop(sid, set())
+            self._sid_index_size -= len(cache_keys)
+            for cache_key in cache_keys:
+                if self._userinfo_cache is not None:
+                    self._userinfo_cache.discard(cache_key)
+                if self._introspection_cache is not None:
+                    self._introspection_cache.discard(cache_key)
+
+    def _store_response(
+        self,
+        cache: "TTLCache[str, CachedResponse]",
+        cache_key: str,
+        response: CachedResponse,
+        ttl: float,
+    ) -> None:
+        """
+        Store a copy of the response in the given cache and remember it under its sid for :meth:`invalidate_sid`
+        """
+        sid = getattr(response, "sid", None)
+        if self._sid_index is None or not isinstance(sid, str):
+            cache.set(cache_key, response.model_copy(deep=True), ttl=ttl)
+            return
+
+        # storing and indexing happen under one lock so that a concurrent invalidate_sid() cannot miss the response
+        with self._sid_lock:
+            cache.set(cache_key, response.model_copy(deep=True), ttl=ttl)
+            cache_keys = self._sid_index.setdefault(sid, set())
+            if cache_key not in cache_keys:
+                cache_keys.add(cache_key)
+                self._sid_index_size += 1
+
+            # the index is never evicted blindly because that would let invalidate_sid() miss cached responses.
+            # instead, the keys of responses which have since left both caches are pruned once the index holds twice as
+            # many keys as were still cached after the last pruning, which keeps the cost of pruning constant per key.
+            if self._sid_index_size > self._sid_index_limit:
+                for indexed_sid in list(self._sid_index):
+                    live_keys = {
+                        key
+                        for key in self._sid_index[indexed_sid]
+                        if (
+                            self._userinfo_cache is not None
+                            and key in self._userinfo_cache
+                        )
+                        or (
+                            self._introspection_cache is not None
+                            and key in self._introspection_cache
+                        )
+                    }
+                    if live_keys:
+                        self._sid_index[indexed_sid] = live_keys
+                    else:
+                        del self._sid_index[indexed_sid]
+                self._sid_index_size = sum(
+                    len(keys) for keys in self._sid_index.values()
+                )
+                self._sid_index_limit = max(
+                    2 * self._sid_index_size, self._max_cache_size
+                )
+
+    @staticmethod
+    def _jwt_expiry(token: str) -> Optional[float]:
+        """
+        The `exp` claim of the token if it is a JWT.
+
+        The signature is not verified because this is only used to not trust a token for longer than it claims to be
+        valid, which is safe regardless of who issued it.
+        Anything that cannot be parsed as a JWT has no expiry so that the OP gets to decide about it.
+        """
+        parts = token.split(".")
+        if len(parts) != 3:
+            return None
+        try:
+            payload = base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4))
+            exp = json.loads(payload)["exp"]
+        except (ValueError, TypeError, KeyError):
+            return None
+        if isinstance(exp, bool) or not isinstance(exp, (int, float)):
+            return None
+        return float(exp)
+
+    @classmethod
+    def _is_expired_jwt(cls, token: str) -> bool:
+        exp = cls._jwt_expiry(token)
+        return exp is not None and exp + JWT_EXPIRY_LEEWAY < time.time()
+
+    @staticmethod
+    def _token_cache_key(token: str) -> str:
+        # tokens are hashed so that they are not kept around in memory in plain text
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _cache_ttl_until(self, exp: Optional[float]) -> float:
+        """
+        For how many seconds a response about a token that expires at *exp* may be cached.
+        """
+        if exp is None:
+            return self.cache_ttl_seconds
+        return min(self.cache_ttl_seconds, exp - time.time())
+
+    def __getstate__(self) -> Tuple[Any, ...]:
         # this implements support for pickling this class
-        # it is basically the default pickle behavior but explicitly serializes keys because they are FFI backed and not normally picklable
-        result = self.__dict__.copy()
-        result["provider_keys"] = [k.serialize() for k in self.provider_keys]
-        return result
+        # only the configuration of the client is serialized, keys explicitly because they are FFI backed and not normally picklable
+        # caches and the http session are left out and start out empty after unpickling
+        return (
+            self.provider_config.dict(),
+            [k.serialize() for k in self.provider_keys],
+            self.authentication_redirect_uri,
+            self.client_auth,
+            self.scope,
+            self._id_token_cache is not None,
+            self.cache_ttl_seconds,
+            self._max_cache_size,
+        )
 
-    def __setstate__(self, state: Dict[str, Any]) -> None:
+    def __setstate__(self, state: Union[Tuple[Any, ...], Dict[str, Any]]) -> None:
         # this implements support for unpickling this class
-        # it is basically the default pickle behavior but explicitly deserializes keys
-        state["provider_keys"] = [key_from_jwk_dict(k) for k in state["provider_keys"]]
-        self.__dict__ = state
+        if isinstance(state, dict):
+            # clients that have been pickled by older versions serialized their whole __dict__
+            state = (
+                state["provider_config"].dict(),
+                state["provider_keys"],
+                state["authentication_redirect_uri"],
+                state["client_auth"],
+                state["scope"],
+                state.get("_id_token_cache") is not None,
+                state.get("cache_ttl_seconds", 0),
+                10_000,
+            )
+
+        (
+            provider_config,
+            provider_keys,
+            authentication_redirect_uri,
+            client_auth,
+            scope,
+            cache_validated_jwts,
+            cache_ttl_seconds,
+            max_cache_size,
+        ) = state
+        # the base implementation is called explicitly because subclasses may override __init__ with another signature
+        OpenidClient.__init__(
+            self,
+            ProviderMetadata.parse_obj(provider_config),
+            [key_from_jwk_dict(k) for k in provider_keys],
+            authentication_redirect_uri,
+            client_auth.client_id,
+            scope=scope,
+            cache_validated_jwts=cache_validated_jwts,
+            cache_ttl_seconds=cache_ttl_seconds,
+            max_cache_size=max_cache_size,
+        )
+        self.client_auth = client_auth
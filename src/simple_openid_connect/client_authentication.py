@@ -10,7 +10,8 @@ For more information visit `Section 9 of OpenID Connect Core 1.0 <https://openid
 """
 
 import abc
-from typing import Any
+import base64
+from typing import Any, Dict
 
 from requests import models
 from requests.auth import AuthBase, HTTPBasicAuth
@@ -72,6 +73,25 @@ class ClientSecretBasicAuth(ClientAuthenticationMethod, HTTPBasicAuth):
         :param client_secret: The client secret which was issued during client registration
         """
         super().__init__(username=client_id, password=client_secret)
+        # the header never changes so it is encoded once instead of on every request
+        self._auth_header = self._encode_auth_header()
+
+    def _encode_auth_header(self) -> str:
+        # latin1 is what requests' HTTPBasicAuth uses as well
+        credentials = b":".join(
+            i.encode("latin1") if isinstance(i, str) else i
+            for i in (self.username, self.password)
+        )
+        return f"Basic {base64.b64encode(credentials).decode('ascii')}"
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # instances pickled by older versions don't carry the precomputed header
+        self.__dict__.update(state)
+        self._auth_header = self._encode_auth_header()
+
+    def __call__(self, r: models.PreparedRequest) -> models.PreparedRequest:
+        r.headers["Authorization"] = self._auth_header
+        return r
 
 
 class AccessTokenBearerAuth(AuthBase):
@@ -205,6 +205,7 @@ class IdToken(OpenidBaseModel):
         min_iat: float = 0,
         validate_acr: Union[Callable[[str], None], None] = None,
         min_auth_time: float = 0,
+        now: Optional[float] = None,
     ) -> None:
         """
         Validate this ID-Token with external data for consistency
@@ -225,6 +226,8 @@ class IdToken(OpenidBaseModel):
             It basically means that if the user was authenticated very far in the past and reused their session, the time at which the original authentication took place must be greater than this value.
             This is only validated if the :data:`IdToken.auth_time` is present in the token.
             This value is a posix timestamp and default to 0 which allows arbitrarily old `auth_time` dates.
+        :param now: The posix timestamp against which the tokens expiry is checked.
+            Defaults to the current time but can be given to validate many tokens against the same point in time.
 
         :raises ValidationError: if the validation fails
         """
@@ -264,7 +267,9 @@ class IdToken(OpenidBaseModel):
             )
 
         # 9. validate expiry
-        validate_that(self.exp > time.time(), "The ID-Token is expired")
+        if now is None:
+            now = time.time()
+        validate_that(self.exp > now, "The ID-Token is expired")
 
         # 10. validate iat
         validate_that(
@@ -341,12 +346,14 @@ class JwtAccessToken(OpenidBaseModel):
     scope: Optional[str] = None
     "OPTIONAL. Scopes to which the token grants access. Multiple scopes are encoded space separated. If the openid scope value is not present, the behavior is entirely unspecified. Other scope values MAY be present."
 
-    def validate_extern(self, issuer: str) -> None:
+    def validate_extern(self, issuer: str, now: Optional[float] = None) -> None:
         """
         Validate this access token with external data for consistency.
 
         :param issuer: The issuer that this token is supposed to originate from.
             Should usually be :data:`ProviderMetadata.issuer`.
+        :param now: The posix timestamp against which the tokens expiry is checked.
+            Defaults to the current time but can be given to validate many tokens against the same point in time.
         """
         # validate issuer
         validate_that(
@@ -355,7 +362,9 @@ class JwtAccessToken(OpenidBaseModel):
         )
 
         # validate expiry
-        validate_that(self.exp > time.time(), "The access token is expired")
+        if now is None:
+            now = time.time()
+        validate_that(self.exp > now, "The access token is expired")
 
 
 class UserinfoRequest(OpenidBaseModel):
@@ -1,29 +1,56 @@
 """
 Mechanisms for discovering information about an OpenID issuer
 """
+from typing import Optional
+
 import requests
 
 from simple_openid_connect import utils
 from simple_openid_connect.data import ProviderMetadata
 from simple_openid_connect.exceptions import OpenidProtocolError
 
+DEFAULT_CACHE_TTL = 60 * 60
+"For how many seconds a discovered configuration is reused if the provider does not specify it via `Cache-Control`"
+
+_cache: utils.TTLCache[str, ProviderMetadata] = utils.TTLCache(maxsize=64)
+
 
-def discover_configuration_from_issuer(issuer: str) -> ProviderMetadata:
+def clear_cache() -> None:
+    """
+    Forget all provider configurations that have been cached by :func:`discover_configuration_from_issuer`.
+    """
+    _cache.clear()
+
+
+def discover_configuration_from_issuer(
+    issuer: str, session: Optional[requests.Session] = None
+) -> ProviderMetadata:
     """
     Retrieve configuration information about an OpenID provider (issuer)
 
     For more information about this process see `Section 4 of OpenID Connect Discovery 1.0 <https://openid.net/specs/openid-connect-discovery-1_0.html#ProviderConfig>`_.
 
+    Retrieved configurations are cached for as long as the provider allows via the `Cache-Control` header of its
+    response (or :data:`DEFAULT_CACHE_TTL` seconds if it doesn't say) so that repeated discovery of the same issuer
+    does not require further requests.
+    Use :func:`clear_cache` to discard them earlier.
+
     :param issuer: The base url of the provider
         This url will be appended with `/.well-known/openid-configuration` to retrieve the provider configuration so
         that must be a valid URL for your provider.
+    :param session: An optional session through which the request is sent e.g. to reuse connections to the OP.
     :returns: The well-formed and validated configuration of the given issuer
     :raises OpenidProtocolError: When the communication with the provider was not possible or the response was not in an
         expected format
     """
     issuer = issuer.rstrip("/")
+    cached = _cache.get(issuer)
+    if cached is not None:
+        # a copy so that callers modifying it don't affect each other
+        return cached.model_copy(deep=True)
+
     config_url = f"{issuer}/.well-known/openid-configuration"
-    response = requests.get(config_url)
+    response = (session or requests).get(config_url)
 
     if not utils.is_application_json(response.headers["Content-Type"]):
         raise OpenidProtocolError(
@@ -39,4 +66,9 @@ def discover_configuration_from_issuer(issuer: str) -> ProviderMetadata:
             "The provider did not respond with a provider configuration according to spec"
         ) from e
 
+    _cache.set(
+        issuer,
+        result.model_copy(deep=True),
+        ttl=utils.cache_lifetime(response.headers, DEFAULT_CACHE_TTL),
+    )
     return result
@@ -5,13 +5,13 @@ The Authorization Server can also authenticate the Client before exchanging the
 
 **The Authorization Code flow is suitable for Clients that can securely maintain a Client Secret between themselves and the Authorization Server.**
 """
-import copy
 import logging
 from typing import Literal, Optional, Union
+from urllib.parse import urlsplit, urlunsplit
 
 import requests
-from furl import furl
 
+from simple_openid_connect import utils
 from simple_openid_connect.client_authentication import ClientAuthenticationMethod
 from simple_openid_connect.data import (
     AuthenticationErrorResponse,
@@ -71,6 +71,7 @@ def handle_authentication_result(
     code_verifier: Optional[str] = None,
     code_challenge: Optional[str] = None,
     code_challenge_method: Optional[str] = None,
+    session: Optional[requests.Session] = None,
 ) -> Union[TokenSuccessResponse, TokenErrorResponse]:
     """
     Handle an authentication result that is communicated to the RP in form of the user agents current url after having started an authentication process via :func:`start_authentication`.
@@ -83,29 +84,28 @@ def handle_authentication_result(
     :param redirect_uri: The `redirect_uri` that was specified during the authentication initiation.
         If the special value `auto` is used, it is assumed that `current_url` is the that callback and it is stripped of query parameters and fragments to reproduce the originally supplied one.
     :param state: The `state` that was specified during the authentication initiation.
+    :param session: An optional session through which the request is sent e.g. to reuse connections to the OP.
 
     :raises AuthenticationFailedError: If the current url indicates an authentication failure that prevents an access token from being retrieved.
     :raises ValidationError: If the returned state does not match the given state.
 
     :returns: The result of the token exchange
     """
-    current_furl = furl(current_url)
-    if "error" in current_furl.query.params.keys():
+    current_url_parts = urlsplit(current_url)
+    if "error" in utils.parse_query(current_url_parts.query):
         raise AuthenticationFailedError(
-            AuthenticationErrorResponse.parse_url(str(current_furl))
+            AuthenticationErrorResponse.parse_url(current_url)
         )
 
     if redirect_uri == "auto":
-        redirect_uri = str(
-            copy.deepcopy(current_furl).remove(fragment=True, query=True)
-        )
+        redirect_uri = urlunsplit(current_url_parts._replace(query="", fragment=""))
         logger.debug(
             f"a redirect_uri value of 'auto' was specified. Reproducing redirect_uri (%s) from current_url (%s)",
             redirect_uri,
-            current_furl,
+            current_url,
         )
 
-    auth_response_msg = AuthenticationSuccessResponse.parse_url(str(current_furl))
+    auth_response_msg = AuthenticationSuccessResponse.parse_url(current_url)
 
     if state != auth_response_msg.state:
         raise ValidationError("Returned state does not match given state.")
@@ -118,6 +118,7 @@ def handle_authentication_result(
         code_verifier=code_verifier,
         code_challenge=code_challenge,
         code_challenge_method=code_challenge_method,
+        session=session,
     )
 
 
@@ -129,6 +130,7 @@ def exchange_code_for_tokens(
     code_verifier: Optional[str] = None,
     code_challenge: Optional[str] = None,
     code_challenge_method: Optional[str] = None,
+    session: Optional[requests.Session] = None,
 ) -> Union[TokenSuccessResponse, TokenErrorResponse]:
     """
     Exchange a received code for access, refresh and id tokens.
@@ -141,6 +143,7 @@ def exchange_code_for_tokens(
         the OP.
     :param redirect_uri: The callback URI that was specified during the authentication initiation.
     :param client_authentication: A way for the client to authenticate itself
+    :param session: An optional session through which the request is sent e.g. to reuse connections to the OP.
 
     :returns: The result of the token exchange
     """
@@ -154,7 +157,7 @@ def exchange_code_for_tokens(
         code_challenge=code_challenge,
         code_challenge_method=code_challenge_method,
     )
-    response = requests.post(
+    response = (session or requests).post(
         token_endpoint,
         data=request_msg.encode_x_www_form_urlencoded(),
         headers={
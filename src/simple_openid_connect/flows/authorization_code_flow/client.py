@@ -1,7 +1,6 @@
 from typing import TYPE_CHECKING, List, Mapping, Optional, Union
 
-from furl import furl
-
+from simple_openid_connect import utils
 from simple_openid_connect.data import (
     AuthenticationSuccessResponse,
     TokenErrorResponse,
@@ -55,13 +54,11 @@ class AuthorizationCodeFlowClient:
                 "The client has no redirect_uri configured so no authentication flow can be started"
             )
 
-        redirect_uri = furl(self._base_client.authentication_redirect_uri)
-
         return impl.start_authentication(
             self._base_client.provider_config.authorization_endpoint,
             self._base_client.scope,
             self._base_client.client_auth.client_id,
-            redirect_uri.tostr(),
+            self._base_client.authentication_redirect_uri,
             state=state,
             nonce=nonce,
             prompt=prompt,
@@ -106,19 +103,22 @@ class AuthorizationCodeFlowClient:
                 "The client has no redirect_uri configured so the authentication result cannot be handled correctly"
             )
 
-        redirect_uri = furl(self._base_client.authentication_redirect_uri)
+        redirect_uri = self._base_client.authentication_redirect_uri
         if additional_redirect_args is not None:
-            redirect_uri.args.update(additional_redirect_args)
+            redirect_uri = utils.update_url_query(
+                redirect_uri, additional_redirect_args
+            )
 
         return impl.handle_authentication_result(
             current_url=current_url,
             token_endpoint=self._base_client.provider_config.token_endpoint,
             client_authentication=self._base_client.client_auth,
-            redirect_uri=redirect_uri.tostr(),
+            redirect_uri=redirect_uri,
             state=state,
             code_verifier=code_verifier,
             code_challenge=code_challenge,
             code_challenge_method=code_challenge_method,
+            session=self._base_client.session,
         )
 
     def exchange_code_for_tokens(
@@ -150,4 +150,5 @@ class AuthorizationCodeFlowClient:
             authentication_response=authentication_response,
             redirect_uri=self._base_client.authentication_redirect_uri,
             client_authentication=self._base_client.client_auth,
+            session=self._base_client.session,
         )
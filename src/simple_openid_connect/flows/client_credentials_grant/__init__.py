@@ -4,7 +4,7 @@ The `*Client Credentials Grant* <https://oauth.net/2/grant-types/client-credenti
 This grant enables a client to retrieve tokens dedicated to the client and not to a specific user.
 """
 import logging
-from typing import Union
+from typing import Optional, Union
 
 import requests
 
@@ -19,7 +19,10 @@ logger = logging.getLogger(__name__)
 
 
 def authenticate(
-    token_endpoint: str, scope: str, client_authentication: ClientAuthenticationMethod
+    token_endpoint: str,
+    scope: str,
+    client_authentication: ClientAuthenticationMethod,
+    session: Optional[requests.Session] = None,
 ) -> Union[TokenSuccessResponse, TokenErrorResponse]:
     """
     Retrieve a token that is dedicated to the authenticated client from the provider.
@@ -28,6 +31,7 @@ def authenticate(
         Corresponds to :data:`ProviderMetadata.token_endpoint <simple_openid_connect.data.ProviderMetadata.token_endpoint>`.
     :param scope: The scope requested by the application.
     :param client_authentication: A way for the client to authenticate itself.
+    :param session: An optional session through which the request is sent e.g. to reuse connections to the OP.
 
     :returns: The result of the exchange
     """
@@ -38,7 +42,7 @@ def authenticate(
         grant_type="client_credentials",
         scope=scope,
     )
-    response = requests.post(
+    response = (session or requests).post(
         token_endpoint,
         data=request_msg.encode_x_www_form_urlencoded(),
         headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -8,7 +8,7 @@ Using this flow, a users credentials (i.e. username and password) are directly s
     The latest `OAuth 2.0 Security Best Current Practices <https://oauth.net/2/oauth-best-practice/>`_ even disallows the password grant entirely.
 """
 import logging
-from typing import Union
+from typing import Optional, Union
 
 import requests
 
@@ -28,6 +28,7 @@ def authenticate(
     username: str,
     password: str,
     client_authentication: ClientAuthenticationMethod,
+    session: Optional[requests.Session] = None,
 ) -> Union[TokenSuccessResponse, TokenErrorResponse]:
     """
     Exchange a given username and password for access, refresh and id tokens.
@@ -38,6 +39,7 @@ def authenticate(
     :param username: Username of the user who should be authenticated.
     :param password: Password of the user who should be authenticated.
     :param client_authentication: A way for the client to authenticate itself
+    :param session: An optional session through which the request is sent e.g. to reuse connections to the OP.
 
     :returns: The result of the exchange
     """
@@ -48,7 +50,7 @@ def authenticate(
         username=username,
         password=password,
     )
-    response = requests.post(
+    response = (session or requests).post(
         token_endpoint,
         data=request_msg.encode_x_www_form_urlencoded(),
         headers={"Content-Type": "application/x-www-form-urlencoded"},
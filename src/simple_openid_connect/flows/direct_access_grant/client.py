@@ -37,4 +37,5 @@ class DirectAccessGrantClient:
             username=username,
             password=password,
             client_authentication=self._base_client.client_auth,
+            session=self._base_client.session,
         )
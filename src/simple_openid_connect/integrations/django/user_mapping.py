@@ -90,10 +90,7 @@ class UserMapper:
         )  # type: JwtAccessToken | TokenIntrospectionSuccessResponse | None
         try:
             # parse an validate the general token structure
-            token = JwtAccessToken.parse_jwt(
-                access_token,
-                oidc_client.provider_keys,
-            )
+            token = oidc_client.parse_jwt(JwtAccessToken, access_token)
             token.validate_extern(oidc_client.provider_config.issuer)
 
             # validate token scope for required access
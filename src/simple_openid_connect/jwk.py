@@ -2,15 +2,98 @@
 JSON-Web-Key handling code
 """
 
-from typing import List
+import time
+from typing import List, NamedTuple, Optional
 
+import requests
 from cryptojwt import JWK, KeyBundle
 
+from simple_openid_connect import utils
+from simple_openid_connect.exceptions import OpenidProtocolError
 
-def fetch_jwks(jwks_uri: str) -> List[JWK]:
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+"For how many seconds fetched keys are reused if the provider does not specify it via `Cache-Control`"
+
+MIN_REFRESH_INTERVAL = 60
+"How many seconds must pass after keys were fetched before a refresh via :func:`fetch_jwks` contacts the provider again"
+
+
+class _CachedKeys(NamedTuple):
+    keys: List[JWK]
+    etag: Optional[str]
+    fetched_at: float
+    fresh_until: float
+
+
+# entries are kept beyond their freshness so that they can be revalidated via their ETag instead of being re-downloaded
+_cache: utils.TTLCache[str, _CachedKeys] = utils.TTLCache(maxsize=64)
+
+
+def clear_cache() -> None:
+    """
+    Forget all keys that have been cached by :func:`fetch_jwks`.
+    """
+    _cache.clear()
+
+
+def fetch_jwks(
+    jwks_uri: str, session: Optional[requests.Session] = None, refresh: bool = False
+) -> List[JWK]:
     """
     Fetch JSON web keys from the given jwks_uri.
     This uri is part of the provider configuration and used to validate responses and tokens sent by the provider.
+
+    Fetched keys are cached for as long as the provider allows via the `Cache-Control` header of its response (or
+    :data:`DEFAULT_CACHE_TTL` seconds if it doesn't say).
+    Afterwards, they are revalidated with a conditional request if the provider sent an `ETag`.
+    Use :func:`clear_cache` to discard them earlier or pass `refresh=True` e.g. when a token was signed with an
+    unknown key because the provider has rotated its keys.
+
+    :param jwks_uri: The uri from which the keys are fetched
+    :param session: An optional session through which the request is sent e.g. to reuse connections to the OP.
+    :param refresh: Whether to ask the provider even though cached keys are still fresh.
+        To not hammer the provider with requests for tokens signed by unknown keys, this is only done if the keys were
+        last fetched more than :data:`MIN_REFRESH_INTERVAL` seconds ago.
+    :raises OpenidProtocolError: When the provider did not respond with a JSON web key set
     """
-    bundle = KeyBundle(source=jwks_uri)
-    return bundle.keys()  # type: ignore # because cryptojwk has no typedefs, but we know what this returns
+    now = time.monotonic()
+    cached = _cache.get(jwks_uri)
+    if cached is not None:
+        if refresh:
+            reusable = cached.fetched_at + MIN_REFRESH_INTERVAL > now
+        else:
+            reusable = cached.fresh_until > now
+        if reusable:
+            # a copy so that callers modifying the list don't affect each other
+            return list(cached.keys)
+
+    headers = {}
+    if cached is not None and cached.etag is not None:
+        headers["If-None-Match"] = cached.etag
+    response = (session or requests).get(jwks_uri, headers=headers)
+    lifetime = utils.cache_lifetime(response.headers, DEFAULT_CACHE_TTL)
+
+    if response.status_code == 304 and cached is not None:
+        keys = cached.keys
+        etag = response.headers.get("ETag", cached.etag)
+    elif response.status_code == 200:
+        try:
+            bundle = KeyBundle(keys=response.json()["keys"])
+        except Exception as e:
+            raise OpenidProtocolError(
+                "The provider did not respond with a JSON web key set", response
+            ) from e
+        keys = bundle.keys()
+        etag = response.headers.get("ETag")
+    else:
+        raise OpenidProtocolError(
+            f"The provider responded to the JWKS request with an unexpected status code {response.status_code}",
+            response,
+        )
+
+    _cache.set(
+        jwks_uri,
+        _CachedKeys(keys, etag, now, now + lifetime),
+        ttl=lifetime + DEFAULT_CACHE_TTL,
+    )
+    return list(keys)
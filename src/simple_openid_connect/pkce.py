@@ -66,6 +66,5 @@ def get_code_challenge(code_verifier: str) -> str:
         msg += "`43 <= len(code_verifier) <= 128`."
         raise ValueError(msg)
     hashed = hashlib.sha256(code_verifier.encode("ascii")).digest()
-    encoded = base64.urlsafe_b64encode(hashed)
-    code_challenge = encoded.decode("ascii")[:-1]
-    return code_challenge
+    # a sha256 digest always encodes to 43 characters plus exactly one "=" of padding which is stripped before decoding
+    return base64.urlsafe_b64encode(hashed)[:-1].decode("ascii")
@@ -2,6 +2,12 @@
 Internal utilities
 """
 import cgi
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Generic, Hashable, List, Mapping, Optional, Tuple, TypeVar
+from urllib.parse import quote_plus, unquote_plus, urlsplit, urlunsplit
 
 from simple_openid_connect.exceptions import ValidationError
 
@@ -15,6 +21,90 @@ def is_application_json(content_type: str) -> bool:
     return main_type == "application/json"
 
 
+def cache_lifetime(headers: Mapping[str, str], default: float) -> float:
+    """
+    Determine for how many seconds a response may be cached based on its `Cache-Control` or `Expires` header.
+
+    :param headers: The headers of the response
+    :param default: The lifetime that is used if the response does not specify one itself
+    :returns: The number of seconds for which the response may be cached which is 0 if it must not be cached at all
+    """
+    cache_control = headers.get("Cache-Control")
+    if cache_control is None:
+        return _expires_lifetime(headers, default)
+
+    directives = {}
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+
+    if "no-store" in directives or "no-cache" in directives:
+        return 0
+    try:
+        return int(directives["max-age"])
+    except (KeyError, ValueError):
+        return _expires_lifetime(headers, default)
+
+
+def _expires_lifetime(headers: Mapping[str, str], default: float) -> float:
+    expires = headers.get("Expires")
+    if expires is None:
+        return default
+    try:
+        return max(0, parsedate_to_datetime(expires).timestamp() - time.time())
+    except (TypeError, ValueError):
+        # invalid dates mean that the response is already expired
+        return 0
+
+
+def encode_query(params: Mapping[str, Any]) -> str:
+    """
+    Encode the given parameters as a `x-www-form-urlencoded` string.
+
+    List values are encoded as repeated keys and `None` values as keys without a value.
+    """
+    parts = []
+    for key, value in params.items():
+        key = quote_plus(key, safe="")
+        for v in value if isinstance(value, (list, tuple)) else (value,):
+            parts.append(key if v is None else f"{key}={quote_plus(str(v), safe='')}")
+    return "&".join(parts)
+
+
+def _parse_query_items(query: str) -> List[Tuple[str, Optional[str]]]:
+    items: List[Tuple[str, Optional[str]]] = []
+    for part in query.split("&"):
+        if part == "":
+            continue
+        key, sep, value = part.partition("=")
+        items.append((unquote_plus(key), unquote_plus(value) if sep else None))
+    return items
+
+
+def parse_query(query: str) -> Dict[str, Optional[str]]:
+    """
+    Parse a `x-www-form-urlencoded` string into a dictionary.
+
+    Keys without a value are parsed as `None` and if a key is repeated, only its first value is used.
+    """
+    params: Dict[str, Optional[str]] = {}
+    for key, value in _parse_query_items(query):
+        params.setdefault(key, value)
+    return params
+
+
+def update_url_query(url: str, params: Mapping[str, Any]) -> str:
+    """
+    Add the given parameters to the query string of an url, replacing existing parameters of the same name.
+    """
+    parts = urlsplit(url)
+    query: Dict[str, Any] = {}
+    for key, value in _parse_query_items(parts.query):
+        query.setdefault(key, []).append(value)
+    query.update(params)
+    return urlunsplit(parts._replace(query=encode_query(query)))
+
+
 def validate_that(condition: bool, msg: str) -> None:
     """
     Validate that the given condition is true, raising a ValidationError with the given message if it is not.
@@ -25,3 +115,83 @@ def validate_that(condition: bool, msg: str) -> None:
     """
     if not condition:
         raise ValidationError(msg)
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    A thread-safe mapping whose entries expire after a per-entry time-to-live and which evicts its least recently used
+    entries once it grows beyond *maxsize*.
+
+    The cache is pickled as an empty cache of the same size since its entries are only an optimization.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Retrieve the value that is stored under the given key or `None` if there is no such value or it has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, ttl: float) -> None:
+        """
+        Store the given value under the given key for *ttl* seconds.
+
+        Values with a non-positive time-to-live are not stored at all.
+        """
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: K) -> None:
+        """
+        Remove the value that is stored under the given key if there is one
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Whether an unexpired value is stored under the given key.
+
+        Unlike :meth:`get` this does not count as a use of the entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)  # type: ignore[arg-type]
+            return entry is not None and entry[0] > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["maxsize"])  # type: ignore[misc]
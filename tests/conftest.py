@@ -1,9 +1,10 @@
+import functools
+import json
 import logging
-import random
-import string
 from base64 import b64encode
 from pathlib import Path
-from typing import Mapping
+from secrets import token_urlsafe
+from typing import Callable, Mapping, Tuple
 
 import pytest
 import requests
@@ -13,21 +14,37 @@ from cryptojwt import JWT, KeyBundle, KeyJar
 from cryptojwt.jwk.rsa import new_rsa_key
 from responses import matchers
 
+from simple_openid_connect import client
 from simple_openid_connect.data import ProviderMetadata
 
 logger = logging.getLogger(__name__)
 
+# bump the version whenever the way in which test keys are generated changes so that stale keys are not reused
+JWKS_CACHE_KEY = "simple_openid_connect/jwks-v1"
+
 
 def rand_str() -> str:
-    return "".join(random.choices(string.ascii_letters + string.digits, k=16))
+    return token_urlsafe(12)
 
 
 @pytest.fixture(scope="session")
-def jwks() -> KeyBundle:
-    """A random JSON-Web-KeySet"""
+def jwks(request) -> KeyBundle:
+    """
+    A random JSON-Web-KeySet
+
+    Generating RSA keys is slow so the keyset is kept in pytest's cache directory and reused by later test runs.
+    """
+    cache = getattr(request.config, "cache", None)
+    if cache is not None:
+        cached_keys = cache.get(JWKS_CACHE_KEY, None)
+        if cached_keys is not None:
+            return KeyBundle(keys=cached_keys)
+
     key = new_rsa_key()
     bundle = KeyBundle()
     bundle.set([key])
+    if cache is not None:
+        cache.set(JWKS_CACHE_KEY, json.loads(bundle.jwks(private=True))["keys"])
     return bundle
 
 
@@ -51,7 +68,15 @@ class DummyUserAgent(requests.Session):
 def user_agent(response_mock) -> DummyUserAgent:
     response_mock.get("https://app.example.com/login-callback")
     response_mock.get("https://app.example.com/logout-callback")
-    yield DummyUserAgent()
+    with DummyUserAgent() as user_agent:
+        yield user_agent
+
+
+@pytest.fixture(autouse=True)
+def provider_cache():
+    """Don't let providers that have been discovered by one test leak into other tests"""
+    yield
+    client.clear_provider_cache()
 
 
 @pytest.fixture
@@ -63,6 +88,21 @@ def response_mock() -> responses.RequestsMock:
         yield mock
 
 
+@pytest.fixture(scope="session")
+def basic_auth_header() -> Callable[[str, str], str]:
+    """
+    A function which returns the ``Authorization`` header value with which a client authenticates via HTTP Basic auth.
+
+    Header values are cached so that each one is only encoded once per test session.
+    """
+
+    @functools.lru_cache()
+    def encode(client_id: str, client_secret: str) -> str:
+        return f"Basic {b64encode(f'{client_id}:{client_secret}'.encode()).decode()}"
+
+    return encode
+
+
 @pytest.fixture
 def known_provider_configs(response_mock):
     """
@@ -88,26 +128,60 @@ def known_provider_configs(response_mock):
     )
 
 
+@pytest.fixture(scope="session")
+def dummy_provider_metadata() -> ProviderMetadata:
+    """Provider configuration of the dummy *https://provider.example.com* provider"""
+    return ProviderMetadata(
+        issuer="https://provider.example.com",
+        authorization_endpoint="https://provider.example.com/auth",
+        token_endpoint="https://provider.example.com/token",
+        jwks_uri="https://provider.example.com/jwks",
+        userinfo_endpoint="https://provider.example.com/userinfo",
+        end_session_endpoint="https://provider.example.com/end-session",
+        introspection_endpoint="https://provider.example.com/token-introspection",
+        subject_types_supported=["public"],
+        id_token_signing_alg_values_supported=["RS256"],
+    )
+
+
+@pytest.fixture(scope="session")
+def dummy_provider_documents(jwks, dummy_provider_metadata) -> Tuple[str, str]:
+    """The serialized configuration and JWKS documents of the dummy *https://provider.example.com* provider"""
+    return dummy_provider_metadata.json(exclude_defaults=True), jwks.jwks()
+
+
+@pytest.fixture(scope="module")
+def openid_client(dummy_provider_metadata, jwks) -> client.OpenidClient:
+    """
+    A confidential client of the dummy *https://provider.example.com* provider
+
+    It is built directly from the providers configuration and keys so no discovery requests are made.
+
+    - client_id: `test-client-id`
+    - client_secret: `test-client-secret`
+    - redirect_uri: `https://app.example.com/login-callback`
+    """
+    return client.OpenidClient(
+        provider_config=dummy_provider_metadata,
+        provider_keys=jwks.keys(),
+        authentication_redirect_uri="https://app.example.com/login-callback",
+        client_id="test-client-id",
+        client_secret="test-client-secret",
+    )
+
+
 @pytest.fixture
-def dummy_provider_config(jwks, response_mock):
+def dummy_provider_config(dummy_provider_documents, response_mock):
     """Mocked responses for the dummy *https://provider.example.com provider*"""
+    config_document, jwks_document = dummy_provider_documents
     response_mock.get(
         url="https://provider.example.com/.well-known/openid-configuration",
-        json=ProviderMetadata(
-            issuer="https://provider.example.com",
-            authorization_endpoint="https://provider.example.com/auth",
-            token_endpoint="https://provider.example.com/token",
-            jwks_uri="https://provider.example.com/jwks",
-            userinfo_endpoint="https://provider.example.com/userinfo",
-            end_session_endpoint="https://provider.example.com/end-session",
-            introspection_endpoint="https://provider.example.com/token-introspection",
-            subject_types_supported=["public"],
-            id_token_signing_alg_values_supported=["RS256"],
-        ).dict(exclude_defaults=True),
+        body=config_document,
+        content_type="application/json",
     )
     response_mock.get(
         url="https://provider.example.com/jwks",
-        body=jwks.jwks(),
+        body=jwks_document,
         content_type="application/json",
     )
 
@@ -142,7 +216,7 @@ def dummy_auth_response(response_mock):
 
 
 @pytest.fixture
-def dummy_token_response(response_mock):
+def dummy_token_response(response_mock, basic_auth_header):
     """
     Mocked response for the token endpoint
 
@@ -168,7 +242,9 @@ def dummy_token_response(response_mock):
             ),
             matchers.header_matcher(
                 {
-                    "Authorization": f"Basic {b64encode(b'test-client-id:test-client-secret').decode()}",
+                    "Authorization": basic_auth_header(
+                        "test-client-id", "test-client-secret"
+                    ),
                 }
             ),
         ],
@@ -229,7 +305,7 @@ def dummy_end_session_response(response_mock):
 
 
 @pytest.fixture
-def dummy_token_introspection_response(response_mock):
+def dummy_token_introspection_response(response_mock, basic_auth_header):
     """
     Mocked response for the token introspection endpoint
 
@@ -251,7 +327,9 @@ def dummy_token_introspection_response(response_mock):
             ),
             matchers.header_matcher(
                 {
-                    "Authorization": f"Basic {b64encode(b'test-client-id:test-client-secret').decode()}",
+                    "Authorization": basic_auth_header(
+                        "test-client-id", "test-client-secret"
+                    ),
                 }
             ),
         ],
@@ -264,7 +342,9 @@ def dummy_token_introspection_response(response_mock):
         match=[
             matchers.header_matcher(
                 {
-                    "Authorization": f"Basic {b64encode(b'test-client-id:test-client-secret').decode()}",
+                    "Authorization": basic_auth_header(
+                        "test-client-id", "test-client-secret"
+                    ),
                 }
             )
         ],
@@ -274,7 +354,7 @@ def dummy_token_introspection_response(response_mock):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def secrets() -> Mapping[str, str]:
     path = Path(__file__).parent / "secrets.yml"
     with open(path, "r", encoding="UTF-8") as f:
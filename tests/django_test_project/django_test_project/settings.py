@@ -8,6 +8,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -19,6 +20,9 @@ SECRET_KEY = "django-insecure-foobar123"
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
 
+# whether the project is loaded by a test runner, in which case development-only tooling is left out
+TESTING = "pytest" in sys.modules or sys.argv[1:2] == ["test"]
+
 ALLOWED_HOSTS = []
 
 INTERNAL_IPS = [
@@ -35,13 +39,11 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
-    "debug_toolbar",
     "simple_openid_connect.integrations.django",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -50,6 +52,12 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+if not TESTING:
+    INSTALLED_APPS.insert(
+        INSTALLED_APPS.index("django.contrib.staticfiles") + 1, "debug_toolbar"
+    )
+    MIDDLEWARE.insert(1, "debug_toolbar.middleware.DebugToolbarMiddleware")
+
 ROOT_URLCONF = "django_test_project.urls"
 
 TEMPLATES = [
@@ -80,6 +88,14 @@ DATABASES = {
     }
 }
 
+# Password hashing
+# https://docs.djangoproject.com/en/3.2/topics/testing/overview/#password-hashing
+# this project only exists for testing so a fast but insecure hasher is used
+
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/3.2/howto/static-files/
 
@@ -1,7 +1,15 @@
-from typing import Any
+import functools
+import json
+import sys
+from importlib import import_module
+from typing import Any, Callable, Iterator, Optional
+from urllib.parse import quote, urlunsplit
 
 import pytest
 import requests
+from cryptojwt import JWS
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
 from django.contrib.auth.models import User
 from django.http import (
     HttpResponse,
@@ -9,7 +17,6 @@ from django.http import (
     HttpResponseRedirect,
 )
 from django.test.client import Client as DjangoClient
-from furl import furl
 
 from simple_openid_connect.integrations.django import models
 
@@ -24,11 +31,20 @@ def dummy_provider_settings(settings):
     settings.OPENID_CLIENT_SECRET = "client-secret"
 
 
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
 class DynClient(DjangoClient):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # external requests share one session so that e.g. redirect chains reuse pooled connections
+        self._session = requests.Session()
+
+    def close(self) -> None:
+        self._session.close()
+
     def request(self, **request: Any) -> HttpResponse:
         # handle internal hosts normally
-        from django.conf import settings
-
         if (
             "SERVER_NAME" not in request.keys()
             or request["SERVER_NAME"] in settings.ALLOWED_HOSTS
@@ -36,23 +52,37 @@ class DynClient(DjangoClient):
             return super().request(**request)
 
         # handle external hosts via request
-        url = furl(
-            scheme=request["wsgi.url_scheme"],
-            host=request["SERVER_NAME"],
-            port=request["SERVER_PORT"] if request["SERVER_PORT"] != "80" else None,
-            path=request["PATH_INFO"],
-            query=request["QUERY_STRING"],
+        scheme = request["wsgi.url_scheme"]
+        netloc = request["SERVER_NAME"]
+        # django's test client reports port 80 even for https urls so it is never treated as explicit
+        if request["SERVER_PORT"] not in ("80", DEFAULT_PORTS[scheme]):
+            netloc += f":{request['SERVER_PORT']}"
+        url = urlunsplit(
+            (
+                scheme,
+                netloc,
+                quote(request["PATH_INFO"]),
+                request["QUERY_STRING"],
+                "",
+            )
         )
-        response = requests.request(
+        response = self._session.request(
             method=request["REQUEST_METHOD"],
-            url=str(url),
+            url=url,
             allow_redirects=False,
         )  # type: requests.Response
+        if response.status_code in (301, 302):
+            # the body of a redirect is not relevant so don't bother reading and decoding it
+            content = b""
+            charset = None
+        else:
+            content = response.content
+            charset = response.encoding or "utf-8"
         base_kwargs = {
-            "content": response.content,
+            "content": content,
             "status": response.status_code,
             "reason": response.reason,
-            "charset": response.apparent_encoding,
+            "charset": charset,
             "headers": response.headers,
         }
         if response.status_code == 302:
@@ -67,9 +97,11 @@ class DynClient(DjangoClient):
 
 
 @pytest.fixture
-def dyn_client(client) -> DynClient:
+def dyn_client(client) -> Iterator[DynClient]:
     """A client that automatically distinguishes between internal django calls and calls to external domains"""
-    return DynClient()
+    dyn = DynClient()
+    yield dyn
+    dyn.close()
 
 
 @pytest.fixture
@@ -77,3 +109,46 @@ def test_user(db) -> User:
     user = User.objects.create_user("user1")
     openid_user = models.OpenidUser.objects.create(sub="1", user=user)
     return user
+
+
+@pytest.fixture
+def test_user_session(test_user) -> str:
+    """
+    The key of a session in which *test_user* is logged in.
+
+    The session is written directly instead of going through django's login machinery which would additionally
+    dispatch login signals and rotate the session.
+    Pass it to a client via ``client.cookies[settings.SESSION_COOKIE_NAME] = test_user_session``.
+    """
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
+    session[SESSION_KEY] = test_user._meta.pk.value_to_string(test_user)
+    session[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+    session[HASH_SESSION_KEY] = test_user.get_session_auth_hash()
+    session.save()
+    return session.session_key
+
+
+@pytest.fixture(scope="session")
+def signed_id_token(jwks) -> Callable[..., str]:
+    """
+    A function which returns an id token for *user1* that is issued and signed by the dummy provider.
+
+    Signing is comparatively expensive so tokens are cached and identical ones only signed once per test session.
+    """
+
+    @functools.lru_cache()
+    def sign(aud: str, nonce: Optional[str] = None) -> str:
+        return JWS(
+            json.dumps(
+                {
+                    "iss": "https://provider.example.com",
+                    "sub": "user1",
+                    "aud": aud,
+                    "iat": 0,
+                    "exp": sys.maxsize,
+                    "nonce": nonce,
+                }
+            )
+        ).sign_compact(jwks)
+
+    return sign
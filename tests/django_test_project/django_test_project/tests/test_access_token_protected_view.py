@@ -1,5 +1,3 @@
-import json
-
 from django.shortcuts import resolve_url
 
 
@@ -48,9 +46,7 @@ def test_invalid_token_json(
     assert response.status_code == 401
     assert response.headers["WWW-Authenticate"] == "Bearer"
     assert response.headers["Content-Type"] == "application/json"
-    json_response = json.loads(response.content)
-    assert json_response["error"] == "invalid_token"
-    assert (
-        json_response["error_description"]
-        == "the used access token is not valid or does not grant enough access"
-    )
+    assert response.json() == {
+        "error": "invalid_token",
+        "error_description": "the used access token is not valid or does not grant enough access",
+    }
@@ -1,18 +1,18 @@
-import random
-import string
+import secrets
 
+from django.conf import settings
 from django.shortcuts import resolve_url
 
 
 def rand_str() -> str:
-    return "".join(random.choices(string.ascii_letters + string.digits, k=16))
+    return secrets.token_urlsafe(12)
 
 
 def test_bare_request(
-    dyn_client, dummy_provider_config, dummy_provider_settings, test_user
+    dyn_client, dummy_provider_config, dummy_provider_settings, test_user_session
 ):
     # arrange
-    dyn_client.force_login(test_user)
+    dyn_client.cookies[settings.SESSION_COOKIE_NAME] = test_user_session
 
     # act
     response = dyn_client.get(
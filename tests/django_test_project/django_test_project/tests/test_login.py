@@ -1,10 +1,8 @@
-import json
 import secrets
-import sys
-from base64 import b64encode
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping
 
 import pytest
-from cryptojwt import JWS
 from django.shortcuts import resolve_url
 from responses import matchers
 
@@ -12,88 +10,137 @@ from simple_openid_connect.integrations.django.apps import OpenidAppConfig
 from simple_openid_connect.integrations.django.views import InvalidAuthStateError
 
 
+@dataclass(frozen=True)
+class Urls:
+    login: str
+    redirect: str
+    after_login: str
+    protected: str
+
+
+@pytest.fixture(scope="module")
+def urls() -> Urls:
+    """Paths of the views that are involved in logging in, resolved once per module"""
+    settings = OpenidAppConfig.get_instance().safe_settings
+    return Urls(
+        login=resolve_url("simple_openid_connect:login"),
+        redirect=resolve_url(settings.OPENID_REDIRECT_URI),
+        after_login=resolve_url("default-after-login"),
+        protected=resolve_url("test-protected-view"),
+    )
+
+
+class OidcFlowMocks:
+    """
+    Builder for the mocked provider responses that are involved in logging in via the authorization code flow
+    """
+
+    def __init__(
+        self,
+        response_mock,
+        urls: Urls,
+        basic_auth_header: Callable[[str, str], str],
+    ):
+        self._response_mock = response_mock
+        self._settings = OpenidAppConfig.get_instance().safe_settings
+        self._redirect_uri = self._settings.OPENID_BASE_URI + urls.redirect
+        self._basic_auth_header = basic_auth_header(
+            self._settings.OPENID_CLIENT_ID, self._settings.OPENID_CLIENT_SECRET
+        )
+
+    def with_auth_redirect(
+        self, nonce: str, code: str = "code.foobar123"
+    ) -> "OidcFlowMocks":
+        """Let the authorization endpoint redirect back to the app with the given code"""
+        self._response_mock.get(
+            url="https://provider.example.com/auth",
+            match=[
+                matchers.query_param_matcher(
+                    {
+                        "client_id": self._settings.OPENID_CLIENT_ID,
+                        "redirect_uri": self._redirect_uri,
+                        "response_type": "code",
+                        "scope": self._settings.OPENID_SCOPE,
+                        "nonce": nonce,
+                    }
+                )
+            ],
+            status=302,
+            headers={"Location": f"{self._redirect_uri}?code={code}"},
+        )
+        return self
+
+    def with_token_response(
+        self, json: Mapping[str, Any], code: str = "code.foobar123"
+    ) -> "OidcFlowMocks":
+        """Let the token endpoint respond to the exchange of the given code with the given json document"""
+        self._response_mock.post(
+            url="https://provider.example.com/token",
+            match=[
+                matchers.urlencoded_params_matcher(
+                    {
+                        "client_id": self._settings.OPENID_CLIENT_ID,
+                        "code": code,
+                        "grant_type": "authorization_code",
+                        "redirect_uri": self._redirect_uri,
+                    }
+                ),
+                matchers.header_matcher(
+                    {
+                        "Authorization": self._basic_auth_header,
+                    }
+                ),
+            ],
+            json=json,
+        )
+        return self
+
+
+@pytest.fixture
+def oidc_flow_mocks(
+    response_mock, dummy_provider_settings, urls, basic_auth_header
+) -> OidcFlowMocks:
+    return OidcFlowMocks(response_mock, urls, basic_auth_header)
+
+
+@pytest.fixture
+def fixed_secret(monkeypatch) -> str:
+    """Let all randomly generated secrets (e.g. the nonce of an authentication request) be the returned constant"""
+    secret = "42"
+    monkeypatch.setattr(secrets, "token_urlsafe", lambda length: secret)
+    return secret
+
+
 @pytest.mark.django_db
 def test_directly_calling_login_endpoint(
     dyn_client,
     dummy_provider_config,
-    dummy_provider_settings,
-    response_mock,
-    jwks,
-    monkeypatch,
+    oidc_flow_mocks,
+    signed_id_token,
+    fixed_secret,
+    urls,
 ):
     # arrange
     settings = OpenidAppConfig.get_instance().safe_settings
-    NONCE = "42"
-    monkeypatch.setattr(secrets, "token_urlsafe", lambda len: NONCE)
-    client_auth = b64encode(
-        f"{settings.OPENID_CLIENT_ID}:{settings.OPENID_CLIENT_SECRET}".encode()
-    ).decode()
-    response_mock.get(
-        url="https://provider.example.com/auth",
-        match=[
-            matchers.query_param_matcher(
-                {
-                    "client_id": settings.OPENID_CLIENT_ID,
-                    "redirect_uri": settings.OPENID_BASE_URI
-                    + resolve_url(settings.OPENID_REDIRECT_URI),
-                    "response_type": "code",
-                    "scope": settings.OPENID_SCOPE,
-                    "nonce": NONCE,
-                }
-            )
-        ],
-        status=302,
-        headers={
-            "Location": settings.OPENID_BASE_URI
-            + resolve_url(settings.OPENID_REDIRECT_URI)
-            + "?code=code.foobar123"
-        },
-    )
-    response_mock.post(
-        url="https://provider.example.com/token",
-        match=[
-            matchers.urlencoded_params_matcher(
-                {
-                    "client_id": settings.OPENID_CLIENT_ID,
-                    "code": "code.foobar123",
-                    "grant_type": "authorization_code",
-                    "redirect_uri": settings.OPENID_BASE_URI
-                    + resolve_url(settings.OPENID_REDIRECT_URI),
-                }
-            ),
-            matchers.header_matcher(
-                {
-                    "Authorization": f"Basic {client_auth}",
-                }
-            ),
-        ],
+    oidc_flow_mocks.with_auth_redirect(nonce=fixed_secret).with_token_response(
         json={
             "access_token": "access_token.foobar123",
             "token_type": "Bearer",
-            "id_token": JWS(
-                json.dumps(
-                    {
-                        "iss": "https://provider.example.com",
-                        "sub": "user1",
-                        "aud": settings.OPENID_CLIENT_ID,
-                        "iat": 0,
-                        "exp": sys.maxsize,
-                        "nonce": NONCE,
-                    }
-                )
-            ).sign_compact(jwks),
-        },
+            "id_token": signed_id_token(
+                aud=settings.OPENID_CLIENT_ID, nonce=fixed_secret
+            ),
+        }
     )
 
     # act
     response = dyn_client.get(
-        "https://app.example.com" + resolve_url("simple_openid_connect:login"),
+        "https://app.example.com" + urls.login,
         follow=True,
     )
 
     # assert
     assert response.status_code == 200
-    assert response.wsgi_request.path == resolve_url("default-after-login")
+    assert response.wsgi_request.path == urls.after_login
     assert response.content == b"default login redirect view"
 
 
@@ -101,89 +148,35 @@ def test_directly_calling_login_endpoint(
 def test_directly_accessing_protected_resource(
     dyn_client,
     dummy_provider_config,
-    dummy_provider_settings,
-    response_mock,
-    jwks,
-    monkeypatch,
+    oidc_flow_mocks,
+    signed_id_token,
+    fixed_secret,
+    urls,
 ):
     # arrange
     settings = OpenidAppConfig.get_instance().safe_settings
-    NONCE = "42"
-    monkeypatch.setattr(secrets, "token_urlsafe", lambda len: NONCE)
-    client_auth = b64encode(
-        f"{settings.OPENID_CLIENT_ID}:{settings.OPENID_CLIENT_SECRET}".encode()
-    ).decode()
-    response_mock.get(
-        url="https://provider.example.com/auth",
-        match=[
-            matchers.query_param_matcher(
-                {
-                    "client_id": settings.OPENID_CLIENT_ID,
-                    "redirect_uri": settings.OPENID_BASE_URI
-                    + resolve_url(settings.OPENID_REDIRECT_URI),
-                    "response_type": "code",
-                    "scope": settings.OPENID_SCOPE,
-                    "nonce": NONCE,
-                }
-            )
-        ],
-        status=302,
-        headers={
-            "Location": settings.OPENID_BASE_URI
-            + resolve_url(settings.OPENID_REDIRECT_URI)
-            + "?code=code.foobar123"
-        },
-    )
-    response_mock.post(
-        url="https://provider.example.com/token",
-        match=[
-            matchers.urlencoded_params_matcher(
-                {
-                    "client_id": settings.OPENID_CLIENT_ID,
-                    "code": "code.foobar123",
-                    "grant_type": "authorization_code",
-                    "redirect_uri": settings.OPENID_BASE_URI
-                    + resolve_url(settings.OPENID_REDIRECT_URI),
-                }
-            ),
-            matchers.header_matcher(
-                {
-                    "Authorization": f"Basic {client_auth}",
-                }
-            ),
-        ],
+    oidc_flow_mocks.with_auth_redirect(nonce=fixed_secret).with_token_response(
         json={
             "access_token": "access_token.foobar123",
             "token_type": "Bearer",
-            "id_token": JWS(
-                json.dumps(
-                    {
-                        "iss": "https://provider.example.com",
-                        "sub": "user1",
-                        "aud": settings.OPENID_CLIENT_ID,
-                        "iat": 0,
-                        "exp": sys.maxsize,
-                        "nonce": NONCE,
-                    }
-                )
-            ).sign_compact(jwks),
-        },
+            "id_token": signed_id_token(
+                aud=settings.OPENID_CLIENT_ID, nonce=fixed_secret
+            ),
+        }
     )
 
     # act
-    response = dyn_client.get(
-        "https://app.example.com" + resolve_url("test-protected-view"), follow=True
-    )
+    response = dyn_client.get("https://app.example.com" + urls.protected, follow=True)
 
     # assert
     assert response.status_code == 200
-    assert response.wsgi_request.path == resolve_url("test-protected-view")
+    assert response.wsgi_request.path == urls.protected
     assert response.content == b"hello user user1"
 
 
 @pytest.mark.django_db
 def test_unsolicited_callback_csrf(
-    dyn_client, dummy_provider_config, dummy_provider_settings, response_mock, jwks
+    dyn_client, dummy_provider_config, dummy_provider_settings, response_mock, urls
 ):
     # arrange
     settings = OpenidAppConfig.get_instance().safe_settings
@@ -192,9 +185,7 @@ def test_unsolicited_callback_csrf(
     # throws ConnectionError when the implementation tries to redeem the code
     with pytest.raises(InvalidAuthStateError):
         response = dyn_client.get(
-            "https://app.example.com"
-            + resolve_url(settings.OPENID_REDIRECT_URI)
-            + "?code=code.foobar123"
+            "https://app.example.com" + urls.redirect + "?code=code.foobar123"
         )
 
     # assert
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.shortcuts import resolve_url
 
 
@@ -13,10 +14,10 @@ def test_logout_redirects_to_op(
 
 
 def test_session_ended_after_logout_view(
-    dyn_client, test_user, dummy_provider_settings, dummy_provider_config
+    dyn_client, test_user_session, dummy_provider_settings, dummy_provider_config
 ):
     # arrange
-    dyn_client.force_login(test_user)
+    dyn_client.cookies[settings.SESSION_COOKIE_NAME] = test_user_session
 
     # act
     response = dyn_client.get(resolve_url("simple_openid_connect:logout"))
@@ -13,6 +13,7 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
 
@@ -28,5 +29,7 @@ urlpatterns = [
         views.test_access_token_view,
         name="access-token-protected-view",
     ),
-    path("__debug__/", include("debug_toolbar.urls")),
 ]
+
+if not settings.TESTING:
+    urlpatterns.append(path("__debug__/", include("debug_toolbar.urls")))
@@ -1,61 +1,115 @@
+import selectors
 import sys
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Callable, Mapping, Tuple
+from typing import Callable, Mapping, Tuple, Union
+from urllib.parse import SplitResult, urlsplit
 
 import pytest
-from furl import furl
+
+# status code, headers and body of a response
+# (bodies can be given as already encoded bytes which are then sent as-is)
+Response = Tuple[int, Mapping[str, str], Union[str, bytes]]
 
 
 class RealAppServer(HTTPServer):
-    login_url = "http://127.0.0.1:8000/login"
-    callback_url = "http://127.0.0.1:8000/callback"
+    # how long to wait for a connection before checking again whether done() has been called
+    timeout = 0.05
 
     _on_login = None
     _on_callback = None
 
     _is_done = False
 
-    def __init__(self):
+    def __init__(self, port: int = 0):
+        """
+        :param port: The local port on which to listen.
+            Defaults to 0 which lets the operating system choose a free one so that multiple servers can run in parallel.
+        """
         super().__init__(
-            ("127.0.0.1", 8000), self.RequestHandler, bind_and_activate=True
+            ("127.0.0.1", port), self.RequestHandler, bind_and_activate=True
         )
+        # never block in accept() even if a connection is gone again by the time it would be accepted
+        self.socket.setblocking(False)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def login_url(self) -> str:
+        return f"{self.base_url}/login"
+
+    @property
+    def callback_url(self) -> str:
+        return f"{self.base_url}/callback"
 
     def serve_until_done(
         self,
-        on_login: Callable[[furl], Tuple[int, Mapping[str, str], str]],
-        on_callback: Callable[[furl], Tuple[int, Mapping[str, str], str]],
+        on_login: Callable[[SplitResult], Response],
+        on_callback: Callable[[SplitResult], Response],
     ):
         self._on_login = on_login
         self._on_callback = on_callback
-        while not self._is_done:
-            self.handle_request()
+        with selectors.DefaultSelector() as selector:
+            selector.register(self, selectors.EVENT_READ)
+            while not self._is_done:
+                if selector.select(self.timeout):
+                    self._handle_request_noblock()
+
+    def get_request(self):
+        request, client_address = super().get_request()
+        # connections are handled synchronously so they must not inherit non-blocking mode from the listening socket
+        request.setblocking(True)
+        return request, client_address
 
     def done(self):
         self._is_done = True
 
+    def reset(self):
+        """Forget the state of a previous test so that the server can be reused"""
+        self._on_login = None
+        self._on_callback = None
+        self._is_done = False
+
     def handle_error(self, request, client_address) -> None:
         # re-raise exceptions so that they can fail the test
         raise sys.exc_info()[1]
 
     class RequestHandler(BaseHTTPRequestHandler):
+        # which server attribute handles requests to a path
+        ROUTES = {
+            "/login": "_on_login",
+            "/callback": "_on_callback",
+        }
+
         def do_GET(self):
-            url = furl(self.path)
-            if url.path == "/login":
-                response = self.server._on_login(url)
-            elif url.path == "/callback":
-                response = self.server._on_callback(url)
+            url = urlsplit(self.path)
+            handler = self.ROUTES.get(url.path)
+            if handler is not None:
+                response = getattr(self.server, handler)(url)
             else:
-                response = 404, {}, "Not found"
+                response = 404, {}, b"Not found"
 
             self.send_response(response[0])
             for k, v in response[1].items():
                 self.send_header(k, v)
             self.end_headers()
-            self.wfile.write(response[2].encode("UTF-8"))
+            body = response[2]
+            if isinstance(body, str):
+                body = body.encode("UTF-8")
+            self.wfile.write(body)
 
 
-@pytest.fixture
-def real_app_server() -> RealAppServer:
+@pytest.fixture(scope="session")
+def real_app_server_session(request) -> RealAppServer:
+    """A server that is bound once and shared by all tests of the session"""
     server = RealAppServer()
-    yield server
-    server.server_close()
+    request.addfinalizer(server.server_close)
+    return server
+
+
+@pytest.fixture
+def real_app_server(real_app_server_session) -> RealAppServer:
+    real_app_server_session.reset()
+    return real_app_server_session
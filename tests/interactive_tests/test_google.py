@@ -1,9 +1,9 @@
 import logging
 from http import HTTPStatus
 from typing import Mapping, Tuple
+from urllib.parse import SplitResult
 
 import pytest
-from furl import furl
 
 from simple_openid_connect.client import OpenidClient
 from simple_openid_connect.data import IdToken, UserinfoSuccessResponse
@@ -11,6 +11,8 @@ from simple_openid_connect.flows.authorization_code_flow import TokenSuccessResp
 
 logger = logging.getLogger(__name__)
 
+SUCCESS_PAGE = b"Success. You can close this tab."
+
 
 @pytest.mark.interactive
 def test_login_with_google(real_app_server, secrets):
@@ -22,7 +24,7 @@ def test_login_with_google(real_app_server, secrets):
     )
     token_response: TokenSuccessResponse
 
-    def on_login(_url: furl) -> Tuple[int, Mapping[str, str], str]:
+    def on_login(_url: SplitResult) -> Tuple[int, Mapping[str, str], str]:
         url = oidc_client.authorization_code_flow.start_authentication()
         return (
             HTTPStatus.FOUND,
@@ -32,15 +34,15 @@ def test_login_with_google(real_app_server, secrets):
             f"Go to {url}",
         )
 
-    def on_login_callback(url: furl) -> Tuple[int, Mapping[str, str], str]:
+    def on_login_callback(url: SplitResult) -> Tuple[int, Mapping[str, str], bytes]:
         nonlocal token_response
         response = oidc_client.authorization_code_flow.handle_authentication_result(
-            str(url)
+            url.geturl()
         )
         assert isinstance(response, TokenSuccessResponse)
         token_response = response
         real_app_server.done()
-        return HTTPStatus.OK, {}, f"Success. You can close this tab."
+        return HTTPStatus.OK, {}, SUCCESS_PAGE
 
     # act (login)
     logger.info(f"Visit {real_app_server.login_url}")
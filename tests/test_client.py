@@ -1,35 +1,65 @@
+import base64
+import json
 import pickle
-import re
-from base64 import b64encode
+import time
+from typing import Any
 
-from responses import matchers
+import pytest
+import requests
+import responses
+from cryptojwt import JWT, KeyBundle, KeyJar
+from cryptojwt.jwk.rsa import new_rsa_key
 
+from simple_openid_connect import jwk
 from simple_openid_connect.client import OpenidClient
 from simple_openid_connect.data import (
+    IdToken,
+    ProviderMetadata,
     RpInitiatedLogoutRequest,
     TokenIntrospectionSuccessResponse,
     UserinfoSuccessResponse,
 )
+from simple_openid_connect.exceptions import ValidationError
 
 
-def make_client() -> OpenidClient:
+def make_client(**kwargs: Any) -> OpenidClient:
+    """
+    A confidential client of the dummy provider which is built via discovery with the given extra arguments
+    """
     return OpenidClient.from_issuer_url(
         url="https://provider.example.com",
         authentication_redirect_uri="https://app.example.com/login-callback",
         client_id="test-client-id",
         client_secret="test-client-secret",
+        **kwargs,
     )
 
 
+def calls_to(response_mock: responses.RequestsMock, url: str) -> int:
+    """
+    How many requests have been sent to the given url
+    """
+    return sum(1 for call in response_mock.calls if call.request.url == url)
+
+
+def make_jwt(exp: float) -> str:
+    """
+    An unsigned JWT that only carries the given `exp` claim
+    """
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=")
+    return f"eyJhbGciOiJub25lIn0.{payload.decode()}.signature"
+
+
 def test_full_authorization_code_flow(
-    user_agent, dummy_provider_config, dummy_auth_response, dummy_token_response
+    user_agent, dummy_auth_response, dummy_token_response, openid_client
 ):
     # act
-    client = make_client()
     response = user_agent.naviagte_to(
-        client.authorization_code_flow.start_authentication()
+        openid_client.authorization_code_flow.start_authentication()
+    )
+    result = openid_client.authorization_code_flow.handle_authentication_result(
+        response.url
     )
-    result = client.authorization_code_flow.handle_authentication_result(response.url)
 
     # assert
     assert result.access_token
@@ -55,12 +85,31 @@ def test_client_type(dummy_provider_config):
     assert confidential_client.client_type == "confidential"
 
 
-def test_fetch_userinfo(user_agent, dummy_provider_config, dumm_userinfo_response):
+def test_provider_caching(dummy_provider_config, response_mock):
+    # act
+    first = make_client()
+    second = make_client()
+
+    # assert
+    assert len(response_mock.calls) == 2
+    assert first.provider_config == second.provider_config
+    assert first.provider_keys == second.provider_keys
+
+
+def test_session_is_shared(dummy_provider_config, response_mock):
     # arrange
-    client = make_client()
+    session = requests.Session()
+
+    # act
+    client = make_client(session=session)
+
+    # assert
+    assert client.session is session
+
 
+def test_fetch_userinfo(user_agent, dumm_userinfo_response, openid_client):
     # act
-    response = client.fetch_userinfo("access_token.foobar123")
+    response = openid_client.fetch_userinfo("access_token.foobar123")
 
     # assert
     assert isinstance(response, UserinfoSuccessResponse)
@@ -68,15 +117,106 @@ def test_fetch_userinfo(user_agent, dummy_provider_config, dumm_userinfo_respons
     assert response.username == "user1"
 
 
-def test_rp_initiated_logout(
-    user_agent, dummy_provider_config, dummy_end_session_response
-):
+def test_userinfo_caching(dummy_provider_config, dumm_userinfo_response, response_mock):
     # arrange
-    client = make_client()
+    client = make_client(cache_ttl_seconds=60)
+
+    # act
+    client.fetch_userinfo("access_token.foobar123")
+    cached = client.fetch_userinfo("access_token.foobar123")
+    client.invalidate_token("access_token.foobar123")
+    client.fetch_userinfo("access_token.foobar123")
+
+    # assert
+    assert cached.username == "user1"
+    assert calls_to(response_mock, "https://provider.example.com/userinfo") == 2
+
+
+def test_invalidate_sid(dummy_provider_config, response_mock):
+    # arrange
+    response_mock.get(
+        url="https://provider.example.com/userinfo",
+        json={"sub": "1", "sid": "session-1"},
+    )
+    client = make_client(cache_ttl_seconds=60)
+
+    # act
+    client.fetch_userinfo("access_token.foo")
+    client.fetch_userinfo("access_token.bar")
+    client.invalidate_sid("session-1")
+    client.fetch_userinfo("access_token.foo")
+    client.fetch_userinfo("access_token.bar")
+
+    # assert
+    assert calls_to(response_mock, "https://provider.example.com/userinfo") == 4
+
+
+def test_invalidate_sid_after_many_sessions(dummy_provider_config, response_mock):
+    # arrange
+    response_mock.get(
+        url="https://provider.example.com/userinfo",
+        json={"sub": "1", "sid": "session-1"},
+    )
+    client = make_client(cache_ttl_seconds=60, max_cache_size=2)
+    client.fetch_userinfo("access_token.foo")
+    # introspection responses of other sessions used to push session-1 out of the index while its userinfo was still cached
+    response_mock.post(
+        url="https://provider.example.com/token-introspection",
+        json={"active": True, "sid": "session-2"},
+    )
+    for i in range(10):
+        response_mock.replace(
+            responses.POST,
+            url="https://provider.example.com/token-introspection",
+            json={"active": True, "sid": f"session-{i + 2}"},
+        )
+        client.introspect_token(f"access_token.{i}")
+
+    # act
+    client.invalidate_sid("session-1")
+    client.fetch_userinfo("access_token.foo")
+
+    # assert
+    assert calls_to(response_mock, "https://provider.example.com/userinfo") == 2
+
+
+def test_sid_index_of_long_lived_session(dummy_provider_config, response_mock):
+    # arrange
+    response_mock.post(
+        url="https://provider.example.com/token-introspection",
+        json={"active": True, "sid": "session-1"},
+    )
+    client = make_client(cache_ttl_seconds=60, max_cache_size=10)
 
     # act
-    plain_url = client.initiate_logout()
-    advanced_url = client.initiate_logout(
+    for i in range(1000):
+        client.introspect_token(f"access_token.{i}")
+
+    # assert
+    assert len(client._sid_index["session-1"]) <= 2 * 10
+
+
+def test_userinfo_caching_of_expired_jwt(dummy_provider_config, response_mock):
+    # arrange
+    response_mock.get(
+        url="https://provider.example.com/userinfo",
+        json={"sub": "1", "username": "user1"},
+    )
+    client = make_client(cache_ttl_seconds=60)
+    token = make_jwt(exp=1)
+
+    # act
+    client.fetch_userinfo(token)
+    client.fetch_userinfo(token)
+
+    # assert
+    assert calls_to(response_mock, "https://provider.example.com/userinfo") == 2
+
+
+def test_rp_initiated_logout(user_agent, dummy_end_session_response, openid_client):
+    # act
+    plain_url = openid_client.initiate_logout()
+    advanced_url = openid_client.initiate_logout(
         RpInitiatedLogoutRequest(
             post_logout_redirect_uri="https://app.example.com/logout-callback"
         )
@@ -92,22 +232,168 @@ def test_rp_initiated_logout(
     assert nav_response.url == "https://app.example.com/logout-callback"
 
 
-def test_token_introspection(dummy_provider_config, dummy_token_introspection_response):
+def test_token_introspection(dummy_token_introspection_response, openid_client):
+    # act
+    response = openid_client.introspect_token("access_token.foobar123")
+
+    # assert
+    assert isinstance(response, TokenIntrospectionSuccessResponse)
+    assert response.active
+
+
+def test_token_introspection_caching(
+    dummy_provider_config, dummy_token_introspection_response, response_mock
+):
     # arrange
-    client = make_client()
+    client = make_client(cache_ttl_seconds=60)
+
+    # act
+    for _ in range(2):
+        active = client.introspect_token("access_token.foobar123")
+        inactive = client.introspect_token("access_token.invalid")
+
+    # assert
+    assert active.active
+    assert not inactive.active
+    assert (
+        calls_to(response_mock, "https://provider.example.com/token-introspection") == 3
+    )
+
+
+@pytest.mark.parametrize(
+    "cache_ttl_seconds,exp,asks_op",
+    [
+        (60, 1, False),
+        # within the leeway for clock skew the OP still gets to decide
+        (60, time.time() - 10, True),
+        # without caching, the OP is always asked
+        (0, 1, True),
+    ],
+)
+def test_expired_jwt_introspection(
+    dummy_provider_config, response_mock, cache_ttl_seconds, exp, asks_op
+):
+    # arrange
+    response_mock.post(
+        url="https://provider.example.com/token-introspection",
+        json={"active": False},
+    )
+    client = make_client(cache_ttl_seconds=cache_ttl_seconds)
 
     # act
-    response = client.introspect_token("access_token.foobar123")
+    response = client.introspect_token(make_jwt(exp))
 
     # assert
     assert isinstance(response, TokenIntrospectionSuccessResponse)
-    assert response.active
+    assert not response.active
+    assert calls_to(
+        response_mock, "https://provider.example.com/token-introspection"
+    ) == (1 if asks_op else 0)
 
 
-def test_pickling(dummy_provider_config):
+def test_pickling(openid_client):
+    # arrange
+    _ = openid_client.session
+
+    # act
+    enc = pickle.dumps(openid_client)
+    restored = pickle.loads(enc)
+
+    # assert
+    assert restored.provider_config == openid_client.provider_config
+    assert restored.provider_keys == openid_client.provider_keys
+    assert restored.client_auth.client_id == openid_client.client_auth.client_id
+    assert restored.authorization_code_flow._base_client is restored
+
+
+class ClientWithOwnInit(OpenidClient):
+    def __init__(self, provider_config: ProviderMetadata, **kwargs: Any):
+        super().__init__(provider_config, **kwargs)
+
+
+def test_pickling_of_subclass(openid_client):
+    # arrange
+    client = ClientWithOwnInit(
+        openid_client.provider_config,
+        provider_keys=openid_client.provider_keys,
+        authentication_redirect_uri="https://app.example.com/login-callback",
+        client_id="test-client-id",
+    )
+
+    # act
+    restored = pickle.loads(pickle.dumps(client))
+
+    # assert
+    assert isinstance(restored, ClientWithOwnInit)
+    assert restored.provider_config == client.provider_config
+
+
+def test_cached_id_token_validation(dummy_provider_config, jwt, monkeypatch):
+    # arrange
+    client = make_client(cache_validated_jwts=True)
+    raw_token = jwt.pack({"sub": "user1"}, aud=["test-client-id"])
+    parsed_tokens = []
+    parse_jwt = IdToken.parse_jwt
+    monkeypatch.setattr(
+        IdToken,
+        "parse_jwt",
+        lambda *args: parsed_tokens.append(args) or parse_jwt(*args),
+    )
+
+    # act
+    trusted = ["test-client-id"]
+    first = client.decode_id_token(raw_token, extra_trusted_audiences=trusted)
+    second = client.decode_id_token(raw_token, extra_trusted_audiences=trusted)
+    second.aud.append("other-client-id")
+    third = client.decode_id_token(raw_token, extra_trusted_audiences=trusted)
+
+    # assert
+    assert first == third
+    assert third.aud == ["test-client-id"]
+    assert len(parsed_tokens) == 1
+    with pytest.raises(ValidationError):
+        client.decode_id_token(raw_token, nonce="foobar123")
+
+
+def test_key_rotation(dummy_provider_config, response_mock, monkeypatch):
     # arrange
     client = make_client()
+    rotated_keys = KeyBundle()
+    rotated_keys.set([new_rsa_key()])
+    jar = KeyJar()
+    jar.add_kb("https://provider.example.com", rotated_keys)
+    raw_token = JWT(jar, "https://provider.example.com", 3600).pack(
+        {"sub": "user1"}, aud="test-client-id"
+    )
+    response_mock.replace(
+        responses.GET,
+        url="https://provider.example.com/jwks",
+        body=rotated_keys.jwks(),
+        content_type="application/json",
+    )
+    monkeypatch.setattr(jwk, "MIN_REFRESH_INTERVAL", 0)
+
+    # act
+    token = client.decode_id_token(raw_token)
+
+    # assert
+    assert token.sub == "user1"
+    assert client.provider_keys == rotated_keys.keys()
+
+
+def test_save_and_load(tmp_path, monkeypatch, openid_client):
+    # arrange
+    path = tmp_path / "client.pickle"
 
-    # act (assert not throwing)
-    enc = pickle.dumps(client)
-    _ = pickle.loads(enc)
+    # act
+    openid_client.save(path)
+    restored = OpenidClient.load(path)
+    missing = OpenidClient.load(tmp_path / "missing.pickle")
+    monkeypatch.setattr(OpenidClient, "PERSISTENCE_VERSION", 2)
+    outdated = OpenidClient.load(path)
+
+    # assert
+    assert restored is not None
+    assert restored.provider_config == openid_client.provider_config
+    assert missing is None
+    assert outdated is None
@@ -1,8 +1,8 @@
+import pickle
 from base64 import b64encode
 
 import pytest
 import requests
-from responses import RequestsMock
 
 from simple_openid_connect.client_authentication import ClientSecretBasicAuth, NoneAuth
 
@@ -35,3 +35,18 @@ def test_client_secret_basic_auth(mock_empty_response):
         response.request.headers["Authorization"]
         == f"Basic {b64encode(b':'.join(['test-id'.encode('ASCII'), 'foobar123'.encode('ASCII')])).decode('ASCII')}"
     )
+
+
+def test_client_secret_basic_auth_from_old_pickle(mock_empty_response):
+    # arrange
+    auth = ClientSecretBasicAuth("test-id", "foobar123")
+    del auth._auth_header  # instances pickled by older versions lack it
+
+    # act
+    restored = pickle.loads(pickle.dumps(auth))
+    response = requests.get("https://example.com", auth=restored)
+
+    # assert
+    assert response.request.headers["Authorization"] == "Basic " + b64encode(
+        b"test-id:foobar123"
+    ).decode("ascii")
@@ -1,5 +1,3 @@
-from base64 import b64encode
-
 import pytest
 from responses import matchers
 
@@ -8,7 +6,7 @@ from simple_openid_connect.flows import client_credentials_grant
 
 
 @pytest.fixture
-def dummy_token_response(response_mock):
+def dummy_token_response(response_mock, basic_auth_header):
     response_mock.post(
         url="https://provider.example.com/token",
         match=[
@@ -20,7 +18,7 @@ def dummy_token_response(response_mock):
             ),
             matchers.header_matcher(
                 {
-                    "Authorization": f"Basic {b64encode(b'client-id:client-secret').decode()}",
+                    "Authorization": basic_auth_header("client-id", "client-secret"),
                 }
             ),
         ],
@@ -42,3 +40,28 @@ def test_auth_exchange(user_agent, dummy_token_response):
 
     # assert
     assert response.access_token
+
+
+def test_auth_exchange_uses_client_session(openid_client, response_mock, monkeypatch):
+    # arrange
+    response_mock.post(
+        url="https://provider.example.com/token",
+        json={
+            "access_token": "access_token.foobar123",
+            "token_type": "Bearer",
+            "id_token": "id_token.foobar123",
+        },
+    )
+    sent = []
+    send = openid_client.session.send
+    monkeypatch.setattr(
+        openid_client.session,
+        "send",
+        lambda request, **kwargs: sent.append(request) or send(request, **kwargs),
+    )
+
+    # act
+    openid_client.client_credentials_grant.authenticate()
+
+    # assert
+    assert [request.url for request in sent] == ["https://provider.example.com/token"]
@@ -1,5 +1,3 @@
-from base64 import b64encode
-
 import pytest
 from responses import matchers
 
@@ -8,7 +6,7 @@ from simple_openid_connect.flows import direct_access_grant
 
 
 @pytest.fixture
-def dummy_token_response(response_mock):
+def dummy_token_response(response_mock, basic_auth_header):
     response_mock.post(
         url="https://provider.example.com/token",
         match=[
@@ -22,7 +20,7 @@ def dummy_token_response(response_mock):
             ),
             matchers.header_matcher(
                 {
-                    "Authorization": f"Basic {b64encode(b'client-id:client-secret').decode()}",
+                    "Authorization": basic_auth_header("client-id", "client-secret"),
                 }
             ),
         ],
@@ -14,6 +14,33 @@ def test_google(known_provider_configs):
     discovery.discover_configuration_from_issuer("https://accounts.google.com")
 
 
+def test_caching(response_mock, dummy_provider_metadata):
+    # arrange
+    response_mock.get(
+        url="https://provider.example.com/.well-known/openid-configuration",
+        json=dummy_provider_metadata.dict(exclude_defaults=True),
+    )
+    response_mock.get(
+        url="https://uncacheable.example.com/.well-known/openid-configuration",
+        json=dummy_provider_metadata.copy(
+            update={"issuer": "https://uncacheable.example.com"}
+        ).dict(exclude_defaults=True),
+        headers={"Cache-Control": "no-store"},
+    )
+
+    # act
+    for _ in range(2):
+        discovery.discover_configuration_from_issuer("https://provider.example.com")
+        discovery.discover_configuration_from_issuer("https://uncacheable.example.com")
+
+    # assert
+    assert [call.request.url for call in response_mock.calls] == [
+        "https://provider.example.com/.well-known/openid-configuration",
+        "https://uncacheable.example.com/.well-known/openid-configuration",
+        "https://uncacheable.example.com/.well-known/openid-configuration",
+    ]
+
+
 def test_errors(known_provider_configs, response_mock):
     # arrange
     response_mock.get(
@@ -1,4 +1,6 @@
+import responses
 from cryptojwt import JWK
+from responses import matchers
 
 from simple_openid_connect.jwk import fetch_jwks
 
@@ -16,3 +18,30 @@ def test_load_dummy_jwks(dummy_provider_config):
     keys = fetch_jwks("https://provider.example.com/jwks")
     assert all(isinstance(k, JWK) for k in keys)
     assert len(keys) == 1
+
+
+def test_caching(response_mock, dummy_provider_documents):
+    # arrange
+    _, jwks_document = dummy_provider_documents
+    response_mock.get(
+        url="https://provider.example.com/jwks",
+        body=jwks_document,
+        content_type="application/json",
+        headers={"Cache-Control": "max-age=0", "ETag": '"v1"'},
+    )
+
+    # act
+    keys = fetch_jwks("https://provider.example.com/jwks")
+    response_mock.replace(
+        responses.GET,
+        url="https://provider.example.com/jwks",
+        status=304,
+        match=[matchers.header_matcher({"If-None-Match": '"v1"'})],
+        headers={"Cache-Control": "max-age=60"},
+    )
+    revalidated_keys = fetch_jwks("https://provider.example.com/jwks")
+    cached_keys = fetch_jwks("https://provider.example.com/jwks")
+
+    # assert
+    assert len(response_mock.calls) == 2
+    assert keys == revalidated_keys == cached_keys
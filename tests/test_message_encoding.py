@@ -1,8 +1,8 @@
 import unittest
 from typing import Optional
 
-from furl import quote as urlquote
-from hypothesis import given
+from hypothesis import given, settings
+from hypothesis import strategies as st
 
 from simple_openid_connect.data import OpenidBaseModel
 
@@ -13,22 +13,25 @@ class DummyMessage(OpenidBaseModel):
     optional_with_default: Optional[str] = "default value"
 
 
-class XwwwFormEncodingTestCase(unittest.TestCase):
-    @given(a=..., b=..., c=...)
-    def test_encode_does_not_throw(self, a: str, b: Optional[str], c: Optional[str]):
-        # setup
-        msg = DummyMessage(required_field=a, optional_field=b, optional_with_default=c)
+@st.composite
+def dummy_messages(draw: st.DrawFn) -> DummyMessage:
+    # model_construct() skips validation which hypothesis would otherwise run for every single example
+    return DummyMessage.model_construct(
+        required_field=draw(st.text()),
+        optional_field=draw(st.none() | st.text()),
+        optional_with_default=draw(st.none() | st.text()),
+    )
+
 
+class XwwwFormEncodingTestCase(unittest.TestCase):
+    @settings(max_examples=25)
+    @given(msg=dummy_messages())
+    def test_encode_does_not_throw(self, msg: DummyMessage):
         # execution
         msg.encode_x_www_form_urlencoded()
 
-    @given(a=..., b=..., c=...)
-    def test_encode_can_be_decoded(self, a: str, b: Optional[str], c: Optional[str]):
-        # setup
-        original_msg = DummyMessage(
-            required_field=a, optional_field=b, optional_with_default=c
-        )
-
+    @given(original_msg=dummy_messages())
+    def test_encode_can_be_decoded(self, original_msg: DummyMessage):
         # execution
         reconstructed_msg = DummyMessage.parse_x_www_form_urlencoded(
             original_msg.encode_x_www_form_urlencoded()
@@ -39,11 +42,12 @@ class XwwwFormEncodingTestCase(unittest.TestCase):
 
 
 class UrlEncodingTestCase(unittest.TestCase):
-    @given(msg=...)
+    @settings(max_examples=25)
+    @given(msg=dummy_messages())
     def test_encode_does_not_throw(self, msg: DummyMessage):
         msg.encode_url("https://example.com")
 
-    @given(msg=...)
+    @given(msg=dummy_messages())
     def test_encode_can_be_decoded(self, msg: DummyMessage):
         # act
         reconstructed_msg = DummyMessage.parse_url(
@@ -53,7 +57,7 @@ class UrlEncodingTestCase(unittest.TestCase):
         # assert
         self.assertEqual(msg, reconstructed_msg)
 
-    @given(msg=...)
+    @given(msg=dummy_messages())
     def test_auto_decode_in_fragment(self, msg: DummyMessage):
         # act
         reconstructed_msg = DummyMessage.parse_url(
@@ -63,7 +67,7 @@ class UrlEncodingTestCase(unittest.TestCase):
         # assert
         self.assertEqual(reconstructed_msg, msg)
 
-    @given(msg=...)
+    @given(msg=dummy_messages())
     def test_auto_decode_in_query(self, msg: DummyMessage):
         # act
         reconstructed_msg = DummyMessage.parse_url(
@@ -1,5 +1,3 @@
-import pytest
-
 from simple_openid_connect import pkce
 
 
@@ -0,0 +1,178 @@
+import contextlib
+import re
+import time
+
+import pytest
+
+from simple_openid_connect.data import IdToken, JwtAccessToken
+from simple_openid_connect.exceptions import ValidationError
+
+# the tests only probe differences of a minute or more, so one timestamp serves the whole module
+NOW = int(time.time())
+
+ISSUER = "https://provider.example.com"
+SUB = "f81d4fae-7dec-11d0-a765-00a0c91e6bf6"
+CLIENT_ID = "test-client"
+OTHER_CLIENT_ID = "other-client"
+
+# arguments to IdToken.validate_extern() for which the tokens built by make_id_token are valid
+VALIDATE_KWARGS = dict(issuer=ISSUER, client_id=CLIENT_ID, now=NOW)
+
+# claims which are shared by all tokens of these tests
+BASE_CLAIMS = dict(
+    iss=ISSUER,
+    sub=SUB,
+    aud=CLIENT_ID,
+    iat=NOW,
+    exp=NOW + 300,
+)
+
+# expected validation errors, compiled once instead of by every pytest.raises()
+ERR_ISSUER = re.compile("was issued from unexpected issuer")
+ERR_AUDIENCE = re.compile("audience does not contain own client_id")
+ERR_UNTRUSTED_AUDIENCE = re.compile("audience are trusted")
+ERR_AZP_MISSING = re.compile("does not contain azp claim")
+ERR_AZP_MISMATCH = re.compile("azp claim mismatch")
+ERR_EXPIRED = re.compile("is expired")
+ERR_IAT = re.compile("issued too far in the past")
+ERR_NONCE = re.compile("nonce does not match")
+ERR_AUTH_TIME = re.compile("authenticated too far in the past")
+ERR_ACR = re.compile("insufficient acr")
+
+
+@pytest.fixture(scope="module")
+def make_id_token():
+    """
+    A factory for valid ID-Tokens in which only the claims relevant to a test need to be given
+    """
+
+    def _make(**overrides) -> IdToken:
+        return IdToken(**{**BASE_CLAIMS, **overrides})
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def access_token() -> JwtAccessToken:
+    """
+    A valid JWT access token from which variations can be derived via `model_copy()`
+    """
+    return JwtAccessToken(**BASE_CLAIMS, client_id=CLIENT_ID, jti="token-1")
+
+
+@pytest.fixture(scope="module")
+def minimal_id_token(make_id_token) -> IdToken:
+    return make_id_token()
+
+
+@pytest.fixture(scope="module")
+def multi_audience_id_token(make_id_token) -> IdToken:
+    return make_id_token(aud=[CLIENT_ID, OTHER_CLIENT_ID], azp=CLIENT_ID)
+
+
+@pytest.fixture(scope="module")
+def nonce_id_token(make_id_token) -> IdToken:
+    return make_id_token(nonce="42")
+
+
+@pytest.fixture(scope="module")
+def aged_id_token(make_id_token) -> IdToken:
+    return make_id_token(iat=NOW - 120, auth_time=NOW - 3600, acr="0")
+
+
+def reject_acr(acr: str) -> None:
+    raise ValidationError(f"insufficient acr {acr}")
+
+
+# (token fixture, arguments deviating from VALIDATE_KWARGS, expected error or None if the token is valid)
+ID_TOKEN_CASES = [
+    ("minimal_id_token", {}, None),
+    (
+        "minimal_id_token",
+        {"issuer": "https://other-provider.example.com"},
+        ERR_ISSUER,
+    ),
+    (
+        "minimal_id_token",
+        {"client_id": OTHER_CLIENT_ID},
+        ERR_AUDIENCE,
+    ),
+    ("minimal_id_token", {"nonce": "42"}, ERR_NONCE),
+    # a token must not be accepted from the moment of its expiry on
+    ("minimal_id_token", {"now": BASE_CLAIMS["exp"] - 1}, None),
+    ("minimal_id_token", {"now": BASE_CLAIMS["exp"]}, ERR_EXPIRED),
+    (
+        "multi_audience_id_token",
+        {"extra_trusted_audiences": [CLIENT_ID, OTHER_CLIENT_ID]},
+        None,
+    ),
+    ("multi_audience_id_token", {}, ERR_UNTRUSTED_AUDIENCE),
+    (
+        "multi_audience_id_token",
+        {
+            "client_id": OTHER_CLIENT_ID,
+            "extra_trusted_audiences": [CLIENT_ID, OTHER_CLIENT_ID],
+        },
+        ERR_AZP_MISMATCH,
+    ),
+    ("nonce_id_token", {"nonce": "42"}, None),
+    ("nonce_id_token", {"nonce": "0"}, ERR_NONCE),
+    ("nonce_id_token", {}, ERR_NONCE),
+    ("aged_id_token", {"min_iat": NOW - 300, "min_auth_time": NOW - 7200}, None),
+    ("aged_id_token", {"min_iat": NOW}, ERR_IAT),
+    ("aged_id_token", {"min_auth_time": NOW}, ERR_AUTH_TIME),
+    ("aged_id_token", {"validate_acr": reject_acr}, ERR_ACR),
+]
+
+
+@pytest.mark.parametrize("token_name,kwargs,exc_match", ID_TOKEN_CASES)
+def test_id_token(request, token_name, kwargs, exc_match):
+    # arrange
+    token = request.getfixturevalue(token_name)
+    expectation = (
+        pytest.raises(ValidationError, match=exc_match)
+        if exc_match is not None
+        else contextlib.nullcontext()
+    )
+
+    # act + assert
+    with expectation:
+        token.validate_extern(**{**VALIDATE_KWARGS, **kwargs})
+
+
+def test_id_token__missing_azp(make_id_token):
+    # arrange
+    token = make_id_token(aud=[CLIENT_ID, OTHER_CLIENT_ID])
+
+    # act + assert
+    with pytest.raises(ValidationError, match=ERR_AZP_MISSING):
+        token.validate_extern(
+            **VALIDATE_KWARGS, extra_trusted_audiences=[CLIENT_ID, OTHER_CLIENT_ID]
+        )
+
+
+def test_id_token__expiry(make_id_token):
+    # arrange
+    token = make_id_token(iat=NOW - 300, exp=NOW - 60)
+
+    # act + assert
+    with pytest.raises(ValidationError, match=ERR_EXPIRED):
+        token.validate_extern(**VALIDATE_KWARGS)
+
+
+def test_jwt_access_token__issuer(access_token):
+    # act + assert
+    access_token.validate_extern(issuer=ISSUER, now=NOW)
+    with pytest.raises(ValidationError, match=ERR_ISSUER):
+        access_token.validate_extern(
+            issuer="https://other-provider.example.com", now=NOW
+        )
+
+
+def test_jwt_access_token__expiry(access_token):
+    # arrange
+    token = access_token.model_copy(update={"iat": NOW - 300, "exp": NOW - 60})
+
+    # act + assert
+    with pytest.raises(ValidationError, match=ERR_EXPIRED):
+        token.validate_extern(issuer=ISSUER, now=NOW)